@@ -121,11 +121,13 @@ def run_cases(
     baseline_root: Path | None = None,
     on_progress: Callable[[int, int, Path, str], None] | None = None,
     should_cancel: Callable[[], bool] | None = None,
+    on_record: Callable[[CaseRunRecord], None] | None = None,
 ) -> list[CaseRunRecord]:
     """
     Run many case folders sequentially and collect a summary.
 
     baseline_root: if provided, compare each case's out/ against baseline_root/<case_name>/out
+    on_record: called with each record as soon as its case finishes (e.g. to stream a report)
     """
     dirs = [Path(p) for p in case_dirs]
     total = max(len(dirs), 1)
@@ -206,48 +208,50 @@ def run_cases(
         else:
             code = None
         elapsed = float(time.perf_counter() - t0)
-        records.append(
-            CaseRunRecord(
-                case_dir=case_dir,
-                status=status,
-                solver_selector=solver_selector,
-                elapsed_s=elapsed,
-                rss_start_mb=rss0,
-                rss_end_mb=rss1,
-                out_dir=out_dir,
-                error_code=code,
-                error=err,
-                diagnostics_zip=diag,
-                compare=cmp,
-            )
+        record = CaseRunRecord(
+            case_dir=case_dir,
+            status=status,
+            solver_selector=solver_selector,
+            elapsed_s=elapsed,
+            rss_start_mb=rss0,
+            rss_end_mb=rss1,
+            out_dir=out_dir,
+            error_code=code,
+            error=err,
+            diagnostics_zip=diag,
+            compare=cmp,
         )
+        records.append(record)
+        if on_record:
+            on_record(record)
         if on_progress:
             on_progress(i, total, case_dir, status)
 
     return records
 
 
+def case_run_record_to_dict(r: CaseRunRecord) -> dict[str, Any]:
+    """
+    JSON-ready form of a record (one entry of a batch report).
+    """
+    return {
+        "case_dir": str(r.case_dir),
+        "status": r.status,
+        "solver_selector": r.solver_selector,
+        "elapsed_s": r.elapsed_s,
+        "rss_start_mb": r.rss_start_mb,
+        "rss_end_mb": r.rss_end_mb,
+        "out_dir": str(r.out_dir) if r.out_dir else None,
+        "error_code": r.error_code,
+        "error": r.error,
+        "diagnostics_zip": (str(r.diagnostics_zip) if r.diagnostics_zip else None),
+        "compare": r.compare,
+    }
+
+
 def write_case_run_report(records: list[CaseRunRecord], out_path: Path) -> Path:
     out_path = Path(out_path)
-    payload = []
-    for r in records:
-        payload.append(
-            {
-                "case_dir": str(r.case_dir),
-                "status": r.status,
-                "solver_selector": r.solver_selector,
-                "elapsed_s": r.elapsed_s,
-                "rss_start_mb": r.rss_start_mb,
-                "rss_end_mb": r.rss_end_mb,
-                "out_dir": str(r.out_dir) if r.out_dir else None,
-                "error_code": r.error_code,
-                "error": r.error,
-                "diagnostics_zip": (
-                    str(r.diagnostics_zip) if r.diagnostics_zip else None
-                ),
-                "compare": r.compare,
-            }
-        )
+    payload = [case_run_record_to_dict(r) for r in records]
     out_path.write_text(
         json.dumps({"records": payload}, indent=2, ensure_ascii=False), encoding="utf-8"
     )
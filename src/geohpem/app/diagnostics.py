@@ -42,11 +42,13 @@ def build_diagnostics_zip(
     error_details: dict[str, Any] | None = None,
     error: str | None = None,
     tb: str | None = None,
-    logs: list[str] | None = None,
+    logs: list[str] | Path | None = None,
     include_out: bool = True,
 ) -> DiagnosticsInfo:
     """
     Create a self-contained diagnostics zip for sharing with solver/platform teams.
+
+    `logs` is either the log lines themselves or the path of a log file to attach.
     """
     case_dir = Path(case_dir)
     diag_dir = case_dir / "_diagnostics"
@@ -75,7 +77,10 @@ def build_diagnostics_zip(
         meta["error"] = error
     if tb:
         meta["traceback"] = tb
-    if logs:
+    log_file = Path(logs) if isinstance(logs, (str, Path)) else None
+    if log_file is not None:
+        meta["log_file"] = "diag/solver.log"
+    elif logs:
         meta["logs"] = logs[-5000:]
 
     def add_file(z: zipfile.ZipFile, src: Path, arc: str) -> None:
@@ -90,6 +95,9 @@ def build_diagnostics_zip(
     with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
         z.writestr("diag/meta.json", json.dumps(meta, indent=2, ensure_ascii=False))
 
+        if log_file is not None:
+            add_file(z, log_file, "diag/solver.log")
+
         # Inputs
         add_file(z, case_dir / "request.json", "case/request.json")
         add_file(z, case_dir / "mesh.npz", "case/mesh.npz")
@@ -40,9 +40,35 @@ def _to_float(v: Any) -> float | None:
         return None
 
 
+def _load_report_records(path: Path) -> Any:
+    """
+    Read raw records from a batch report.
+
+    Accepts both the JSON form ({"records": [...]}, written by the CLI) and the
+    JSON-lines form (one record per line, streamed by the GUI batch runner).
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = None
+    if isinstance(data, dict) and "records" in data:
+        return data.get("records", [])
+    recs: list[Any] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            recs.append(json.loads(line))
+        except json.JSONDecodeError:
+            # A run killed mid-write can leave a truncated last line.
+            continue
+    return recs
+
+
 def parse_batch_report(path: Path) -> list[BatchReportRecord]:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
-    recs = data.get("records", [])
+    recs = _load_report_records(path)
     out: list[BatchReportRecord] = []
     if not isinstance(recs, list):
         return out
@@ -209,7 +235,10 @@ class BatchReportDialog:
 
     def _open_report(self) -> None:
         file, _ = self._QFileDialog.getOpenFileName(
-            self._dialog, "Open Batch Report", "", "JSON (*.json);;All Files (*)"
+            self._dialog,
+            "Open Batch Report",
+            "",
+            "Batch Reports (*.jsonl *.json);;All Files (*)",
         )
         if not file:
             return
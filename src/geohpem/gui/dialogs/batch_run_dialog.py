@@ -146,7 +146,7 @@ class BatchRunDialog:
             if d:
                 self._root.setText(d)
                 # default report path
-                self._report.setText(str(Path(d) / "batch_report.json"))
+                self._report.setText(str(Path(d) / "batch_report.jsonl"))
 
         def browse_base() -> None:
             d = self._QFileDialog.getExistingDirectory(
@@ -157,7 +157,7 @@ class BatchRunDialog:
 
         def browse_report() -> None:
             f, _ = self._QFileDialog.getSaveFileName(
-                self._dialog, "Report Path", "", "JSON (*.json);;All Files (*)"
+                self._dialog, "Report Path", "", "JSON Lines (*.jsonl);;All Files (*)"
             )
             if f:
                 self._report.setText(f)
@@ -198,7 +198,7 @@ class BatchRunDialog:
             baseline = b
 
         report_txt = self._report.text().strip()
-        report_path = Path(report_txt) if report_txt else (root / "batch_report.json")
+        report_path = Path(report_txt) if report_txt else (root / "batch_report.jsonl")
 
         self._btn_run.setEnabled(False)
         self._btn_close.setEnabled(False)
@@ -82,19 +82,25 @@ class MainWindow:
         outer = self
 
         class _UiSlots(QObject):
-            @Slot(object)
-            def on_output_ready(self, out_dir) -> None:  # noqa: ANN001
+            @Slot(str)
+            def on_output_ready(self, out_dir: str) -> None:
                 outer.open_output_folder(Path(out_dir))
 
-            @Slot(str, object)
-            def on_solver_failed(
-                self, error_text: str, diag_path
-            ) -> None:  # noqa: ANN001
-                outer._on_solver_failed(error_text, diag_path)
+            @Slot(str, str)
+            def on_solver_failed(self, error_text: str, diag_path: str) -> None:
+                outer._on_solver_failed(
+                    error_text, Path(diag_path) if diag_path else None
+                )
+
+            @Slot(str)
+            def on_solver_canceled(self, diag_path: str) -> None:
+                outer._on_solver_canceled(Path(diag_path) if diag_path else None)
 
-            @Slot(object)
-            def on_solver_canceled(self, diag_path) -> None:  # noqa: ANN001
-                outer._on_solver_canceled(diag_path)
+            @Slot(str)
+            def on_solver_diagnostics_ready(self, diag_path: str) -> None:
+                outer._on_solver_diagnostics_ready(
+                    Path(diag_path) if diag_path else None
+                )
 
         self._ui_slots = _UiSlots()
 
@@ -147,6 +153,7 @@ class MainWindow:
         self.model = ProjectModel()
         self.selection = SelectionModel()
         self._active_workers: list[object] = []
+        self._solver_msgbox = None
         self._unit_context = None  # UnitContext | None
         self._solver_caps_cache: dict[str, dict[str, Any]] = {}
 
@@ -1244,6 +1251,8 @@ class MainWindow:
                 worker.failed.connect(self._ui_slots.on_solver_failed)  # type: ignore[attr-defined]
             if hasattr(worker, "canceled"):
                 worker.canceled.connect(self._ui_slots.on_solver_canceled)  # type: ignore[attr-defined]
+            if hasattr(worker, "diagnostics_ready"):
+                worker.diagnostics_ready.connect(self._ui_slots.on_solver_diagnostics_ready)  # type: ignore[attr-defined]
             worker.start()
         except Exception as exc:
             self._QMessageBox.critical(self._win, "Run Failed", str(exc))
@@ -1255,7 +1264,7 @@ class MainWindow:
                 msg += f"\n\nDiagnostics:\n{diag_path}"
             except Exception:
                 pass
-        self._QMessageBox.critical(self._win, "Solve Failed", msg)
+        self._show_solver_message(self._QMessageBox.Critical, "Solve Failed", msg)
         self.log_dock.append_info(msg)
 
     def _on_solver_canceled(self, diag_path) -> None:  # noqa: ANN001
@@ -1265,9 +1274,33 @@ class MainWindow:
                 msg += f"\n\nDiagnostics:\n{diag_path}"
             except Exception:
                 pass
-        self._QMessageBox.information(self._win, "Solve", msg)
+        self._show_solver_message(self._QMessageBox.Information, "Solve", msg)
         self.log_dock.append_info(msg)
 
+    def _show_solver_message(self, icon, title: str, msg: str) -> None:  # noqa: ANN001
+        # Kept while open so a diagnostics zip finishing later can be appended.
+        box = self._QMessageBox(self._win)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(msg)
+        self._solver_msgbox = box
+        try:
+            box.exec()
+        finally:
+            self._solver_msgbox = None
+
+    def _on_solver_diagnostics_ready(self, diag_path) -> None:  # noqa: ANN001
+        if not diag_path:
+            return
+        line = f"Diagnostics:\n{diag_path}"
+        box = self._solver_msgbox
+        if box is not None:
+            try:
+                box.setText(f"{box.text()}\n\n{line}")
+            except Exception:
+                pass
+        self.log_dock.append_info(line)
+
     def _suggest_material_id(self) -> str:
         state = self.model.state()
         mats = {}
@@ -51,11 +51,11 @@ class TasksDock:
                 outer._set_state("Idle")
                 outer._clear_worker()
 
-            @Slot(str, object)
+            @Slot(str, str)
             def on_failed(self, *_args) -> None:
                 outer._set_state("Failed")
 
-            @Slot(object)
+            @Slot(str)
             def on_canceled(self, *_args) -> None:
                 outer._set_state("Canceled")
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass
 from typing import Any
 
-from geohpem.util.ids import new_uid
+from geohpem.util.ids import new_uid_prefixed, uid_prefix
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,6 +17,24 @@ class StageItemTableConfig:
     default_type: str
 
 
+def _cell_text(v: Any) -> str:
+    if isinstance(v, str):
+        return v
+    return "" if v is None else str(v)
+
+
+def _value_text(val: Any) -> str:
+    # Scalars (the common case) never need json.dumps.
+    if val is None:
+        return ""
+    if isinstance(val, (dict, list)):
+        try:
+            return json.dumps(val, ensure_ascii=False)
+        except Exception:
+            return str(val)
+    return str(val)
+
+
 class StageItemTableEditor:
     """
     Table editor for stage.bcs or stage.loads.
@@ -24,6 +43,9 @@ class StageItemTableEditor:
     - Keep stable uid (generate if missing).
     - Preserve unknown fields by carrying an original dict per row and only updating known keys.
     - Provide a set-name dropdown (editable combo).
+
+    Rows live in a plain list[dict] behind a QAbstractTableModel; the view only
+    creates cell editors (combo boxes) for the cell being edited.
     """
 
     COL_UID = 0
@@ -32,8 +54,10 @@ class StageItemTableEditor:
     COL_SET = 3
     COL_VALUE = 4
 
+    _COLUMN_KEYS = ("uid", "field", "type", "set", "value")
+
     def __init__(self, parent, *, config: StageItemTableConfig) -> None:  # noqa: ANN001
-        from PySide6.QtCore import Qt  # type: ignore
+        from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt  # type: ignore
         from PySide6.QtWidgets import (
             QAbstractItemView,  # type: ignore
             QComboBox,
@@ -41,8 +65,8 @@ class StageItemTableEditor:
             QLabel,
             QMessageBox,
             QPushButton,
-            QTableWidget,
-            QTableWidgetItem,
+            QStyledItemDelegate,
+            QTableView,
             QTabWidget,
             QVBoxLayout,
             QWidget,
@@ -50,11 +74,11 @@ class StageItemTableEditor:
 
         self._Qt = Qt
         self._QMessageBox = QMessageBox
-        self._QTableWidgetItem = QTableWidgetItem
-        self._QComboBox = QComboBox
         from geohpem.gui.widgets.json_editor import JsonEditorWidget
 
         self.config = config
+        # Normalized once; rows without a uid get one on every load.
+        self._uid_prefix = uid_prefix(config.uid_prefix)
         self.widget = QWidget(parent)
         layout = QVBoxLayout(self.widget)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -75,28 +99,167 @@ class StageItemTableEditor:
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs, 1)
 
+        outer = self
+        keys = self._COLUMN_KEYS
+        edit_roles = (Qt.DisplayRole, Qt.EditRole)
+
+        class _StageModel(QAbstractTableModel):
+            def __init__(self) -> None:
+                super().__init__()
+                self._rows: list[dict[str, Any]] = []
+                # Row contents as loaded/added; a cleared cell falls back to these.
+                self._base: list[dict[str, Any]] = []
+
+            def rows(self) -> list[dict[str, Any]]:
+                return self._rows
+
+            def set_rows(self, rows: list[dict[str, Any]]) -> None:
+                self.beginResetModel()
+                self._rows = rows
+                self._base = [dict(r) for r in rows]
+                self.endResetModel()
+
+            def append_row(self, obj: dict[str, Any]) -> int:
+                r = len(self._rows)
+                self.beginInsertRows(QModelIndex(), r, r)
+                self._rows.append(obj)
+                self._base.append(dict(obj))
+                self.endInsertRows()
+                return r
+
+            def remove_row(self, r: int) -> None:
+                self.beginRemoveRows(QModelIndex(), r, r)
+                del self._rows[r]
+                del self._base[r]
+                self.endRemoveRows()
+
+            def row_changed(self, r: int) -> None:
+                self.dataChanged.emit(
+                    self.index(r, 0), self.index(r, len(keys) - 1), list(edit_roles)
+                )
+
+            def rowCount(self, parent=QModelIndex()) -> int:  # noqa: ANN001, N802
+                return 0 if parent.isValid() else len(self._rows)
+
+            def columnCount(self, parent=QModelIndex()) -> int:  # noqa: ANN001, N802
+                return 0 if parent.isValid() else len(keys)
+
+            def headerData(
+                self, section, orientation, role=Qt.DisplayRole
+            ):  # noqa: ANN001, N802
+                if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+                    return keys[section] if 0 <= section < len(keys) else None
+                return super().headerData(section, orientation, role)
+
+            def flags(self, index):  # noqa: ANN001
+                if not index.isValid():
+                    return Qt.NoItemFlags
+                f = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+                if index.column() != outer.COL_UID:
+                    f |= Qt.ItemIsEditable
+                return f
+
+            def data(self, index, role=Qt.DisplayRole):  # noqa: ANN001
+                if not index.isValid() or role not in edit_roles:
+                    return None
+                obj = self._rows[index.row()]
+                col = index.column()
+                if col == outer.COL_VALUE:
+                    return _value_text(obj.get("value", ""))
+                return _cell_text(obj.get(keys[col], ""))
+
+            def setData(self, index, value, role=Qt.EditRole):  # noqa: ANN001, N802
+                if not index.isValid() or role != Qt.EditRole:
+                    return False
+                col = index.column()
+                if col == outer.COL_UID:
+                    return False
+                text = _cell_text(value).strip()
+                if text == (self.data(index, Qt.EditRole) or "").strip():
+                    return False
+                obj = self._rows[index.row()]
+                key = "value" if col == outer.COL_VALUE else keys[col]
+                if not text:
+                    # A blank cell keeps the row's original entry (the
+                    # table-widget editor behaved the same on Apply).
+                    base = self._base[index.row()]
+                    if key in base:
+                        obj[key] = base[key]
+                    else:
+                        obj.pop(key, None)
+                elif col == outer.COL_VALUE:
+                    try:
+                        obj["value"] = json.loads(text)
+                    except Exception:
+                        # keep raw string if invalid JSON
+                        obj["value"] = text
+                else:
+                    obj[keys[col]] = text
+                # The rows no longer match the caller's list.
+                outer._last_items_ref = None
+                self.dataChanged.emit(index, index, list(edit_roles))
+                if col == outer.COL_TYPE and text:
+                    outer._apply_type_preset_to_row(index.row(), text)
+                return True
+
+        class _ComboDelegate(QStyledItemDelegate):
+            """
+            Editable combo editor for the field/type/set columns.
+            """
+
+            def __init__(self, options_attr: str, parent) -> None:  # noqa: ANN001
+                super().__init__(parent)
+                self._options_attr = options_attr
+
+            def createEditor(self, parent, option, index):  # noqa: ANN001, N802
+                cb = QComboBox(parent)
+                cb.setEditable(True)
+                # Commit as soon as an entry is picked (presets react to type).
+                cb.activated.connect(lambda _i, w=cb: self.commitData.emit(w))
+                return cb
+
+            def setEditorData(self, editor, index) -> None:  # noqa: ANN001, N802
+                current = _cell_text(index.data(Qt.EditRole))
+                outer._populate_combo(
+                    editor, getattr(outer, self._options_attr), current
+                )
+
+            def setModelData(self, editor, model, index) -> None:  # noqa: ANN001, N802
+                model.setData(index, editor.currentText().strip(), Qt.EditRole)
+
         # Table tab
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["uid", "field", "type", "set", "value"])
+        self._model = _StageModel()
+        self.table = QTableView()
+        self.table.setModel(self._model)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setEditTriggers(
             QAbstractItemView.DoubleClicked
+            | QAbstractItemView.SelectedClicked
             | QAbstractItemView.EditKeyPressed
             | QAbstractItemView.AnyKeyPressed
         )
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.tabs.addTab(self.table, "Table")
+        for col, attr in (
+            (self.COL_FIELD, "_field_options"),
+            (self.COL_TYPE, "_type_options"),
+            (self.COL_SET, "_set_options"),
+        ):
+            self.table.setItemDelegateForColumn(col, _ComboDelegate(attr, self.table))
+        self._table_tab_index = self.tabs.addTab(self.table, "Table")
 
         # JSON tab (advanced)
         self.json_edit = JsonEditorWidget(show_toolbar=False)
-        self.tabs.addTab(self.json_edit, "JSON")
+        self._json_tab_index = self.tabs.addTab(self.json_edit, "JSON")
 
         self._set_options: list[str] = []
         self._field_options: list[str] = []
         self._type_options: list[str] = []
         self._type_presets: dict[str, dict[str, Any]] = {}
+        # Hash of the data last pushed into json_edit (skip no-op rebuilds).
+        self._last_json_hash: int | None = None
+        # List object last passed to set_items (identity fast path).
+        self._last_items_ref: list[dict[str, Any]] | None = None
 
         self.btn_add.clicked.connect(self._on_add)
         self.btn_delete.clicked.connect(self._on_delete)
@@ -105,52 +268,42 @@ class StageItemTableEditor:
 
     def _on_tab_changed(self, index: int) -> None:
         # Keep JSON tab in sync with the table when user views it.
-        if index == self.tabs.indexOf(self.json_edit):
+        if index == self._json_tab_index:
             try:
-                self.json_edit.set_data(self.items())
+                self._refresh_json(self.items())
             except Exception:
                 pass
+        else:
+            # The user may have edited the JSON text; force the next refresh.
+            self._last_json_hash = None
+
+    def _refresh_json(self, data: list[dict[str, Any]]) -> None:
+        """
+        Push data into the JSON tab unless it matches what is already shown.
+        """
+        try:
+            h = hash(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+        except Exception:
+            h = None
+        if h is not None and h == self._last_json_hash:
+            return
+        self._last_json_hash = None
+        self.json_edit.set_data(data)
+        self._last_json_hash = h
 
     def set_set_options(self, names: list[str]) -> None:
+        # Combo editors are created on demand and read the options then.
         self._set_options = list(names)
-        # Update existing comboboxes.
-        for row in range(self.table.rowCount()):
-            cb = self.table.cellWidget(row, self.COL_SET)
-            if cb is None:
-                continue
-            try:
-                current = str(cb.currentText())
-            except Exception:
-                current = ""
-            self._populate_set_combo(cb, current)
 
     def set_field_options(self, names: list[str]) -> None:
         self._field_options = [
             str(n) for n in names if isinstance(n, str) and str(n).strip()
         ]
-        for row in range(self.table.rowCount()):
-            cb = self.table.cellWidget(row, self.COL_FIELD)
-            if cb is None:
-                continue
-            try:
-                current = str(cb.currentText())
-            except Exception:
-                current = ""
-            self._populate_field_combo(cb, current)
 
     def set_type_options(self, names: list[str]) -> None:
         self._type_options = [
             str(n) for n in names if isinstance(n, str) and str(n).strip()
         ]
-        for row in range(self.table.rowCount()):
-            cb = self.table.cellWidget(row, self.COL_TYPE)
-            if cb is None:
-                continue
-            try:
-                current = str(cb.currentText())
-            except Exception:
-                current = ""
-            self._populate_type_combo(cb, current)
 
     def set_type_presets(self, presets: dict[str, dict[str, Any]]) -> None:
         """
@@ -167,220 +320,80 @@ class StageItemTableEditor:
         self._type_presets = out
 
     def set_items(self, items: list[dict[str, Any]]) -> None:
-        self.table.setRowCount(0)
+        # Re-selecting the same stage hands back the same list object; skip the
+        # rebuild while the table is unedited (every edit clears the ref, so
+        # pending edits are discarded by a reload as before). Callers that
+        # change a list in place must pass a new list.
+        if items is self._last_items_ref and len(items) == self._model.rowCount():
+            return
+        self._last_items_ref = None
         normalized: list[dict[str, Any]] = []
         for it in items:
             if not isinstance(it, dict):
                 continue
+            # The model edits rows in place; never alias the caller's dicts.
+            it = dict(it)
             uid = it.get("uid")
             if not isinstance(uid, str) or not uid:
-                it = dict(it)
-                it["uid"] = new_uid(self.config.uid_prefix)
+                it["uid"] = new_uid_prefixed(self._uid_prefix)
             normalized.append(it)
-
-        for it in normalized:
-            self._append_row(it)
+        self._model.set_rows(normalized)
 
         # also refresh JSON view
         try:
-            self.json_edit.set_data(normalized)
+            self._refresh_json(normalized)
         except Exception:
             self.json_edit.set_data([])
+        self._last_items_ref = items
 
     def items(self) -> list[dict[str, Any]]:
         out: list[dict[str, Any]] = []
-        for row in range(self.table.rowCount()):
-            uid_item = self.table.item(row, self.COL_UID)
-            if uid_item is None:
-                continue
-            base = uid_item.data(self._Qt.UserRole)
-            if isinstance(base, dict):
-                obj = dict(base)
-            else:
-                obj = {}
-
-            uid = str(uid_item.text()).strip()
-            if not uid:
-                uid = new_uid(self.config.uid_prefix)
-            obj["uid"] = uid
-
-            field = self._combo_or_text(row, self.COL_FIELD)
-            if field:
-                obj["field"] = field
-
-            typ = self._combo_or_text(row, self.COL_TYPE)
-            if typ:
-                obj["type"] = typ
-
-            set_name = self._set_text(row)
-            if set_name:
-                obj["set"] = set_name
-
-            value_text = self._text(row, self.COL_VALUE)
-            if value_text.strip():
-                try:
-                    obj["value"] = json.loads(value_text)
-                except Exception:
-                    # keep raw string if invalid JSON
-                    obj["value"] = value_text
-
-            out.append(obj)
+        for obj in self._model.rows():
+            o = dict(obj)
+            uid = _cell_text(o.get("uid")).strip()
+            o["uid"] = uid or new_uid_prefixed(self._uid_prefix)
+            out.append(o)
 
         # Keep JSON tab in sync (read-only-ish)
         try:
-            self.json_edit.set_data(out)
+            self._refresh_json(out)
         except Exception:
             pass
         return out
 
-    def _text(self, row: int, col: int) -> str:
-        it = self.table.item(row, col)
-        return str(it.text()).strip() if it is not None else ""
-
-    def _combo_or_text(self, row: int, col: int) -> str:
-        cb = self.table.cellWidget(row, col)
-        if cb is not None:
-            try:
-                return str(cb.currentText()).strip()
-            except Exception:
-                return ""
-        return self._text(row, col)
-
-    def _set_text(self, row: int) -> str:
-        cb = self.table.cellWidget(row, self.COL_SET)
-        if cb is None:
-            return ""
-        try:
-            return str(cb.currentText()).strip()
-        except Exception:
-            return ""
-
-    def _append_row(self, obj: dict[str, Any]) -> None:
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-
-        uid = (
-            str(obj.get("uid", ""))
-            if isinstance(obj.get("uid"), str)
-            else new_uid(self.config.uid_prefix)
-        )
-        it_uid = self._QTableWidgetItem(uid)
-        it_uid.setFlags(it_uid.flags() & ~self._Qt.ItemIsEditable)
-        it_uid.setData(self._Qt.UserRole, dict(obj))
-        self.table.setItem(r, self.COL_UID, it_uid)
-
-        cb_field = self._QComboBox()
-        cb_field.setEditable(True)
-        self._populate_field_combo(cb_field, str(obj.get("field", "")))
-        self.table.setCellWidget(r, self.COL_FIELD, cb_field)
-
-        cb_type = self._QComboBox()
-        cb_type.setEditable(True)
-        self._populate_type_combo(cb_type, str(obj.get("type", "")))
-        cb_type.currentTextChanged.connect(
-            lambda _txt, w=cb_type: self._on_type_changed(w)
-        )
-        self.table.setCellWidget(r, self.COL_TYPE, cb_type)
-
-        cb = self._QComboBox()
-        cb.setEditable(True)
-        self._populate_set_combo(cb, str(obj.get("set", "")))
-        self.table.setCellWidget(r, self.COL_SET, cb)
-
-        val = obj.get("value", "")
-        try:
-            if isinstance(val, (dict, list)):
-                val_txt = json.dumps(val, ensure_ascii=False)
-            else:
-                val_txt = "" if val is None else str(val)
-        except Exception:
-            val_txt = "" if val is None else str(val)
-        it_val = self._QTableWidgetItem(val_txt)
-        self.table.setItem(r, self.COL_VALUE, it_val)
-
-    def _find_row_of_widget(self, widget, col: int) -> int | None:  # noqa: ANN001
-        for row in range(self.table.rowCount()):
-            if self.table.cellWidget(row, col) is widget:
-                return row
-        return None
-
     def _apply_type_preset_to_row(self, row: int, typ: str) -> None:
         preset = self._type_presets.get(typ)
         if not isinstance(preset, dict):
             return
+        rows = self._model.rows()
+        if not (0 <= row < len(rows)):
+            return
+        obj = rows[row]
+        changed = False
 
         # Field
         field = preset.get("field")
-        cb_field = self.table.cellWidget(row, self.COL_FIELD)
-        if cb_field is not None and isinstance(field, str) and field.strip():
-            try:
-                if not str(cb_field.currentText()).strip():
-                    cb_field.setCurrentText(field)
-            except Exception:
-                pass
+        if isinstance(field, str) and field.strip():
+            if not _cell_text(obj.get("field")).strip():
+                obj["field"] = field
+                changed = True
 
         # Value (only fill if empty)
-        it_val = self.table.item(row, self.COL_VALUE)
-        if it_val is None:
-            return
-        if str(it_val.text()).strip():
-            return
-        if "value" not in preset:
-            return
-        try:
-            v = preset.get("value")
-            if isinstance(v, (dict, list, int, float, bool)) or v is None:
-                it_val.setText(
-                    json.dumps(v, ensure_ascii=False)
-                    if isinstance(v, (dict, list))
-                    else ("" if v is None else str(v))
-                )
-            else:
-                it_val.setText(str(v))
-        except Exception:
-            return
-
-    def _on_type_changed(self, cb_type) -> None:  # noqa: ANN001
-        row = self._find_row_of_widget(cb_type, self.COL_TYPE)
-        if row is None:
-            return
-        try:
-            typ = str(cb_type.currentText()).strip()
-        except Exception:
-            typ = ""
-        if not typ:
-            return
-        self._apply_type_preset_to_row(row, typ)
-
-    def _populate_set_combo(self, combo, current: str) -> None:  # noqa: ANN001
-        combo.blockSignals(True)
-        combo.clear()
-        combo.addItem("")
-        for n in self._set_options:
-            combo.addItem(n)
-        if current and combo.findText(current) < 0:
-            combo.addItem(current)
-        if current:
-            combo.setCurrentText(current)
-        combo.blockSignals(False)
+        if "value" in preset and not _value_text(obj.get("value")).strip():
+            obj["value"] = copy.deepcopy(preset.get("value"))
+            changed = True
 
-    def _populate_field_combo(self, combo, current: str) -> None:  # noqa: ANN001
-        combo.blockSignals(True)
-        combo.clear()
-        combo.addItem("")
-        for n in self._field_options:
-            combo.addItem(n)
-        if current and combo.findText(current) < 0:
-            combo.addItem(current)
-        if current:
-            combo.setCurrentText(current)
-        combo.blockSignals(False)
+        if changed:
+            self._last_items_ref = None
+            self._model.row_changed(row)
 
-    def _populate_type_combo(self, combo, current: str) -> None:  # noqa: ANN001
+    def _populate_combo(
+        self, combo, options: list[str], current: str
+    ) -> None:  # noqa: ANN001
         combo.blockSignals(True)
         combo.clear()
         combo.addItem("")
-        for n in self._type_options:
+        for n in options:
             combo.addItem(n)
         if current and combo.findText(current) < 0:
             combo.addItem(current)
@@ -393,7 +406,7 @@ class StageItemTableEditor:
             self._type_options[0] if self._type_options else self.config.default_type
         )
         obj: dict[str, Any] = {
-            "uid": new_uid(self.config.uid_prefix),
+            "uid": new_uid_prefixed(self._uid_prefix),
             "field": self.config.default_field,
             "type": default_type,
             "set": "",
@@ -404,21 +417,21 @@ class StageItemTableEditor:
             if isinstance(preset.get("field"), str) and preset.get("field"):
                 obj["field"] = str(preset.get("field"))
             if "value" in preset:
-                obj["value"] = preset.get("value")
+                obj["value"] = copy.deepcopy(preset.get("value"))
         if "value" not in obj:
             obj["value"] = [0.0, 0.0] if self.config.kind == "bc" else 0.0
-        self._append_row(obj)
+        self._last_items_ref = None
+        row = self._model.append_row(obj)
         # One more time: if value is empty and preset exists, auto-fill.
-        row = self.table.rowCount() - 1
-        if row >= 0:
-            self._apply_type_preset_to_row(row, str(obj.get("type", "")).strip())
-        self.table.selectRow(self.table.rowCount() - 1)
+        self._apply_type_preset_to_row(row, str(obj.get("type", "")).strip())
+        self.table.selectRow(row)
 
     def _on_delete(self) -> None:
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             return
-        self.table.removeRow(row)
+        self._last_items_ref = None
+        self._model.remove_row(row)
 
     def _on_sync_json_to_table(self) -> None:
         try:
@@ -437,6 +450,6 @@ class StageItemTableEditor:
             cleaned.append(it)
         self.set_items(cleaned)
         try:
-            self.tabs.setCurrentIndex(self.tabs.indexOf(self.table))
+            self.tabs.setCurrentIndex(self._table_tab_index)
         except Exception:
             pass
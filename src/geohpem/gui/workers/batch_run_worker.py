@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
 import time
 from pathlib import Path
 from typing import Any, Callable
 
+# Cap the rate of intermediate progress updates sent to the GUI thread (~30/s).
+_PROGRESS_MIN_INTERVAL_S = 1.0 / 30.0
+
 
 class BatchRunWorker:
     """
@@ -42,6 +46,8 @@ class BatchRunWorker:
                 self._baseline_root = Path(baseline_root) if baseline_root else None
                 self._report_path = Path(report_path)
                 self._cancel = False
+                self._last_emit = 0.0
+                self._log_batch: list[str] = []
                 self.cancel_requested.connect(self._on_cancel)
 
             @Slot()
@@ -49,12 +55,18 @@ class BatchRunWorker:
                 self._cancel = True
                 self.log.emit("Cancel requested...")
 
+            def _flush_logs(self) -> None:
+                batch, self._log_batch = self._log_batch, []
+                if batch:
+                    self.log.emit("\n".join(batch))
+
             @Slot()
             def run(self) -> None:
                 from geohpem.app.case_runner import (
+                    CaseRunRecord,
+                    case_run_record_to_dict,
                     discover_case_folders,
                     run_cases,
-                    write_case_run_report,
                 )
 
                 self.started.emit()
@@ -70,6 +82,18 @@ class BatchRunWorker:
                 def on_progress(
                     i: int, total: int, case_dir: Path, status: str
                 ) -> None:
+                    self._log_batch.append(f"{status}: {case_dir}")
+                    # Always report case boundaries (final status, first/last case);
+                    # throttle "running" updates so fast cases do not flood the GUI.
+                    now = time.perf_counter()
+                    boundary = status != "running" or i in (1, total)
+                    if (
+                        not boundary
+                        and now - self._last_emit < _PROGRESS_MIN_INTERVAL_S
+                    ):
+                        return
+                    self._last_emit = now
+
                     # Rough overall progress, one case at a time.
                     pct = int(((i - 1) / max(total, 1)) * 100)
                     if status == "running":
@@ -80,16 +104,30 @@ class BatchRunWorker:
                         self.progress.emit(
                             pct, f"[{i}/{total}] {status.upper()}: {case_dir.name}"
                         )
-                    self.log.emit(f"{status}: {case_dir}")
-
-                records = run_cases(
-                    cases,
-                    solver_selector=self._solver_selector,
-                    baseline_root=self._baseline_root,
-                    on_progress=on_progress,
-                    should_cancel=lambda: bool(self._cancel),
-                )
-                write_case_run_report(records, self._report_path)
+                    # Every update that passes the throttle also delivers the log.
+                    self._flush_logs()
+
+                # Stream the report as JSON lines (one record per finished case),
+                # so it stays usable if the batch is canceled or crashes mid-way.
+                self._report_path.parent.mkdir(parents=True, exist_ok=True)
+                with self._report_path.open("w", encoding="utf-8") as report:
+
+                    def on_record(rec: CaseRunRecord) -> None:
+                        report.write(
+                            json.dumps(case_run_record_to_dict(rec), ensure_ascii=False)
+                        )
+                        report.write("\n")
+                        report.flush()
+
+                    records = run_cases(
+                        cases,
+                        solver_selector=self._solver_selector,
+                        baseline_root=self._baseline_root,
+                        on_progress=on_progress,
+                        should_cancel=lambda: bool(self._cancel),
+                        on_record=on_record,
+                    )
+                self._flush_logs()
                 elapsed = time.perf_counter() - t0
 
                 total = len(records)
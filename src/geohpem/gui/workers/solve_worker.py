@@ -1,8 +1,46 @@
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+from collections import deque
 from pathlib import Path
 from typing import Any, Callable
 
+from geohpem.app.diagnostics import build_diagnostics_zip
+from geohpem.app.error_mapping import map_exception
+from geohpem.app.errors import CancelledError
+from geohpem.app.run_case import run_case
+from geohpem.solver_adapter.loader import load_solver
+
+# Progress ticks that keep the same percent are coalesced to one emit per interval;
+# a GUI-side timer with the same period delivers the last coalesced tick.
+_PROGRESS_MIN_INTERVAL_NS = 50_000_000
+_PUMP_INTERVAL_MS = 50
+# Solver log lines are forwarded to the GUI in batches at most this often.
+_LOG_FLUSH_INTERVAL_NS = 100_000_000
+# Solver logs are streamed to this file in the case folder (buffered, flushed ~1/s).
+_RUN_LOG_NAME = ".run.log"
+_RUN_LOG_BUFFER = 8192
+_RUN_LOG_FLUSH_INTERVAL_NS = 1_000_000_000
+# Fallback when the log file cannot be opened: keep a bounded ring of lines.
+_LOG_RING_DEFAULT = 5000
+
+
+def _log_ring_size() -> int:
+    try:
+        n = int(os.environ.get("GEOHPEM_LOG_RING", _LOG_RING_DEFAULT))
+    except ValueError:
+        n = _LOG_RING_DEFAULT
+    return max(n, 1)
+
+
+def _diag_on_cancel() -> bool:
+    return os.environ.get("GEOHPEM_DIAG_ON_CANCEL", "").strip() not in ("", "0")
+
 
 class SolveWorker:
     """
@@ -12,138 +50,307 @@ class SolveWorker:
     """
 
     def __init__(self, case_dir: Path, solver_selector: str) -> None:
-        from PySide6.QtCore import QObject, QThread, Signal, Slot  # type: ignore
+        from PySide6.QtCore import (  # type: ignore
+            QObject,
+            QThread,
+            QThreadPool,
+            QTimer,
+            Signal,
+            Slot,
+        )
 
         class _Worker(QObject):
             started = Signal()
             finished = Signal()
             progress = Signal(int, str)
             log = Signal(str)
-            output_ready = Signal(object)  # Path
-            failed = Signal(str, object)  # error_text, diag_zip_path (Path|None)
-            canceled = Signal(object)  # diag_zip_path (Path|None)
-            cancel_requested = Signal()
+            # Paths travel as str ("" = none): typed signals marshal cheaper
+            # across threads than Signal(object).
+            output_ready = Signal(str)  # out_dir
+            failed = Signal(str, str)  # error_text, diag_zip_path
+            canceled = Signal(str)  # diag_zip_path
+            diagnostics_ready = Signal(str)  # diag_zip_path
 
             def __init__(self, case_dir: Path, solver_selector: str) -> None:
                 super().__init__()
-                self._case_dir = case_dir
+                self._log_fh = None
+                self._caps: dict[str, Any] | None = None
+                self._case_dir = Path(case_dir)
+                self._case_dir_str = str(self._case_dir)
                 self._solver_selector = solver_selector
                 self._cancel = False
-                self._logs: list[str] = []
+                self._logs: deque[str] = deque(maxlen=_log_ring_size())
+                self._last_pct = -1
+                self._last_emit_ns = 0
+                self._pending_progress: tuple[int, str] | None = None
+                # Guards the progress gate against the GUI-thread drain.
+                self._progress_lock = threading.Lock()
+                self._last_fmt_key: tuple[Any, Any, Any] = (None, None, None)
+                self._last_fmt_str = ""
+                # Appended on the worker thread, drained only on the GUI thread
+                # (SolveWorker's pump), so lines keep their order.
+                self._log_batch: deque[str] = deque()
+                self._log_path = self._case_dir / _RUN_LOG_NAME
+                self._last_log_fh_flush_ns = 0
+                # Built once; the solver calls these on every step.
+                self._callbacks: dict[str, Callable[..., Any]] = {
+                    "on_progress": self._on_progress,
+                    "should_cancel": self._should_cancel,
+                    "on_log": self._on_log,
+                }
 
-                self.cancel_requested.connect(self._on_cancel_requested)
+            def _on_progress(
+                self, p: float, message: str, stage_id: str, step: int
+            ) -> None:
+                percent = int(max(0.0, min(1.0, p)) * 100)
+                # Reuse the last string when only the percent moved.
+                key = (stage_id, step, message)
+                if key == self._last_fmt_key:
+                    text = self._last_fmt_str
+                else:
+                    text = f"{stage_id} step {step}: {message}"
+                    self._last_fmt_key = key
+                    self._last_fmt_str = text
+                # Solvers may report thousands of tiny steps; only cross
+                # threads when the percent moves or the interval elapsed.
+                now = time.monotonic_ns()
+                with self._progress_lock:
+                    if (
+                        percent == self._last_pct
+                        and now - self._last_emit_ns < _PROGRESS_MIN_INTERVAL_NS
+                    ):
+                        self._pending_progress = (percent, text)
+                        return
+                    self._pending_progress = None
+                    self._last_pct = percent
+                    self._last_emit_ns = now
+                    self.progress.emit(percent, text)
 
-            @Slot()
-            def _on_cancel_requested(self) -> None:
-                self._cancel = True
-                self.log.emit("Cancel requested...")
+            def _record_log(self, line: str) -> None:
+                fh = self._log_fh
+                if fh is None:
+                    self._logs.append(line)
+                    return
+                try:
+                    fh.write(line)
+                    fh.write("\n")
+                    now = time.monotonic_ns()
+                    if now - self._last_log_fh_flush_ns >= _RUN_LOG_FLUSH_INTERVAL_NS:
+                        fh.flush()
+                        self._last_log_fh_flush_ns = now
+                except Exception:
+                    self._logs.append(line)
 
-            @Slot()
-            def run(self) -> None:
-                import traceback
+            def _open_log_file(self) -> None:
+                try:
+                    self._log_fh = open(
+                        self._log_path, "w", encoding="utf-8", buffering=_RUN_LOG_BUFFER
+                    )
+                except Exception:
+                    self._log_fh = None
 
-                from geohpem.app.diagnostics import build_diagnostics_zip
-                from geohpem.app.error_mapping import map_exception
-                from geohpem.app.errors import CancelledError
-                from geohpem.app.run_case import run_case
+            def _close_log_file(self) -> None:
+                fh, self._log_fh = self._log_fh, None
+                if fh is not None:
+                    try:
+                        fh.close()
+                    except Exception:
+                        pass
 
-                self.started.emit()
-                self.progress.emit(1, "Starting...")
-                self.log.emit(f"Running solver: {self._solver_selector}")
-                self._logs.append(f"Running solver: {self._solver_selector}")
+            def _on_log(self, level: str, msg: str) -> None:
+                line = f"{level}: {msg}"
+                self._record_log(line)
+                # One signal per batch instead of one per line (see drain_logs).
+                self._log_batch.append(line)
 
-                def on_progress(
-                    p: float, message: str, stage_id: str, step: int
-                ) -> None:
-                    percent = int(max(0.0, min(1.0, p)) * 100)
-                    self.progress.emit(percent, f"{stage_id} step {step}: {message}")
+            def _should_cancel(self) -> bool:
+                return self._cancel
 
-                def on_log(level: str, msg: str) -> None:
-                    line = f"{level}: {msg}"
-                    self._logs.append(line)
-                    self.log.emit(line)
+            def request_cancel(self) -> None:
+                """
+                Thread-safe: may be called directly from any thread (no event
+                loop round-trip). Only assigns a bool, which is atomic under the GIL.
+                """
+                self._cancel = True
+
+            def _flush_progress(self) -> None:
+                """
+                Emit a coalesced progress tick, if any; safe from either thread.
+                """
+                with self._progress_lock:
+                    pending, self._pending_progress = self._pending_progress, None
+                    if pending is not None:
+                        self._last_emit_ns = time.monotonic_ns()
+                if pending is not None:
+                    self.progress.emit(*pending)
+
+            def drain_logs(self) -> None:
+                """
+                Emit the buffered log lines as one batch. GUI thread only.
+                """
+                q = self._log_batch
+                n = len(q)
+                if n:
+                    self.log.emit("\n".join([q.popleft() for _ in range(n)]))
 
-                callbacks: dict[str, Callable[..., Any]] = {
-                    "on_progress": on_progress,
-                    "should_cancel": lambda: bool(self._cancel),
-                    "on_log": on_log,
+            def _load_capabilities(self) -> None:
+                # Best-effort; fetched up front so the error path does not have
+                # to load the solver plugin again.
+                if self._caps is not None:
+                    return
+                try:
+                    caps = load_solver(self._solver_selector).capabilities()
+                except Exception:
+                    caps = None
+                self._caps = caps if isinstance(caps, dict) else None
+
+            def _start_diag(
+                self,
+                info,  # noqa: ANN001
+                msg: str,
+                tb: str,
+                *,
+                include_out: bool = True,
+            ) -> None:
+                """
+                Build the diagnostics zip for a failed/canceled run in the
+                background; emits diagnostics_ready(zip_path) when it is written.
+                """
+                # Everything the task reads is bound here. The log is attached
+                # from a copy: the next run in the same case folder reopens
+                # .run.log with "w" while this zip may still be building.
+                case_dir = self._case_dir
+                logs: list[str] | Path = list(self._logs)
+                snapshot: Path | None = None
+                if self._log_fh is not None:
+                    try:
+                        self._log_fh.flush()
+                        fd, tmp = tempfile.mkstemp(prefix="geohpem_run_", suffix=".log")
+                        os.close(fd)
+                        snapshot = Path(tmp)
+                        shutil.copyfile(self._log_path, snapshot)
+                        logs = snapshot
+                    except Exception:
+                        # Copy failed: attach the live file rather than nothing.
+                        if snapshot is not None:
+                            snapshot.unlink(missing_ok=True)
+                            snapshot = None
+                        logs = self._log_path
+                kwargs: dict[str, Any] = {
+                    "solver_selector": self._solver_selector,
+                    "capabilities": self._caps,
+                    "error_code": info.code,
+                    "error_details": info.details,
+                    "error": msg,
+                    "tb": tb,
+                    "logs": logs,
+                    "include_out": include_out,
                 }
 
+                def task() -> None:
+                    try:
+                        zip_path = build_diagnostics_zip(case_dir, **kwargs).zip_path
+                    except Exception:
+                        return
+                    finally:
+                        if snapshot is not None:
+                            snapshot.unlink(missing_ok=True)
+                    self.diagnostics_ready.emit(str(zip_path))
+
+                QThreadPool.globalInstance().start(task)
+
+            @Slot()
+            def run(self) -> None:
+                self.started.emit()
+                self.progress.emit(1, "Starting...")
+                self._log_batch.append(f"Running solver: {self._solver_selector}")
+                self._open_log_file()
+                self._record_log(f"Running solver: {self._solver_selector}")
+
+                # Loading the solver plugin can take a while on first use.
+                self.progress.emit(2, "Loading solver...")
+                self._load_capabilities()
                 try:
                     if self._cancel:
                         raise CancelledError("Cancelled by user")
                     out_dir = run_case(
-                        str(self._case_dir),
+                        self._case_dir_str,
                         solver_selector=self._solver_selector,
-                        callbacks=callbacks,
+                        callbacks=self._callbacks,
                     )
+                    self._flush_progress()
                     self.progress.emit(100, "Completed")
-                    self.output_ready.emit(out_dir)
+                    self.output_ready.emit(str(out_dir))
                 except CancelledError as exc:
+                    self._flush_progress()
                     info = map_exception(exc)
                     msg = f"[{info.code}] {info.message}"
-                    tb = traceback.format_exc()
-                    diag = None
-                    try:
-                        caps = None
-                        try:
-                            from geohpem.solver_adapter.loader import load_solver
-
-                            caps = load_solver(self._solver_selector).capabilities()
-                        except Exception:
-                            caps = None
-                        diag = build_diagnostics_zip(
-                            Path(self._case_dir),
-                            solver_selector=self._solver_selector,
-                            capabilities=caps if isinstance(caps, dict) else None,
-                            error_code=info.code,
-                            error_details=info.details,
-                            error=msg,
-                            tb=tb,
-                            logs=self._logs,
-                            include_out=True,
-                        ).zip_path
-                    except Exception:
-                        diag = None
-                    self.log.emit("CANCELED")
-                    self.canceled.emit(diag)
+                    self._log_batch.append("CANCELED")
+                    self.canceled.emit("")
+                    # A user cancel rarely needs a diagnostics zip; opt in via env.
+                    # The partial outputs are left out.
+                    if _diag_on_cancel():
+                        # No traceback: a user cancel is fully described by msg.
+                        self._start_diag(info, msg, "", include_out=False)
                 except Exception as exc:
                     tb = traceback.format_exc()
+                    self._flush_progress()
                     info = map_exception(exc)
                     msg = f"[{info.code}] {info.message}"
-                    diag = None
-                    try:
-                        # Try capture solver capabilities for diagnostics (best-effort).
-                        caps = None
-                        try:
-                            from geohpem.solver_adapter.loader import load_solver
-
-                            caps = load_solver(self._solver_selector).capabilities()
-                        except Exception:
-                            caps = None
-                        diag = build_diagnostics_zip(
-                            Path(self._case_dir),
-                            solver_selector=self._solver_selector,
-                            capabilities=caps if isinstance(caps, dict) else None,
-                            error_code=info.code,
-                            error_details=info.details,
-                            error=msg,
-                            tb=tb,
-                            logs=self._logs,
-                            include_out=True,
-                        ).zip_path
-                    except Exception:
-                        diag = None
-
-                    self.log.emit(f"FAILED: {msg}")
-                    self.failed.emit(msg, diag)
+                    # Report the failure right away; the zip follows via
+                    # diagnostics_ready once it has been written.
+                    self._log_batch.append(f"FAILED: {msg}")
+                    self.failed.emit(msg, "")
+                    self._start_diag(info, msg, tb)
                 finally:
+                    self._close_log_file()
                     self.finished.emit()
 
         self._thread = QThread()
         self._worker = _Worker(case_dir=case_dir, solver_selector=solver_selector)
         self._worker.moveToThread(self._thread)
 
+        worker = self._worker
+
+        class _Pump(QObject):
+            """
+            GUI-thread side: delivers coalesced progress and batched log lines
+            while the worker thread is busy inside the solver.
+            """
+
+            def __init__(self) -> None:
+                super().__init__()
+                self._last_log_ns = 0
+
+            @Slot()
+            def tick(self) -> None:
+                worker._flush_progress()
+                now = time.monotonic_ns()
+                if now - self._last_log_ns >= _LOG_FLUSH_INTERVAL_NS:
+                    self._last_log_ns = now
+                    worker.drain_logs()
+
+            @Slot()
+            def drain(self) -> None:
+                worker._flush_progress()
+                worker.drain_logs()
+
+            @Slot()
+            def on_finished(self) -> None:
+                timer.stop()
+                self.drain()
+
+        self._pump = _Pump()
+        timer = self._pump_timer = QTimer(self._pump)
+        timer.setInterval(_PUMP_INTERVAL_MS)
+        timer.timeout.connect(self._pump.tick)
+        # Connected before any outside receiver, so the last lines are
+        # delivered before they see the run end.
+        self._worker.output_ready.connect(self._pump.drain)
+        self._worker.failed.connect(self._pump.drain)
+        self._worker.canceled.connect(self._pump.drain)
+        self._worker.finished.connect(self._pump.on_finished)
+
         self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._thread.quit)
         self._thread.finished.connect(self._thread.deleteLater)
@@ -155,15 +362,20 @@ class SolveWorker:
         self.output_ready = self._worker.output_ready
         self.failed = self._worker.failed
         self.canceled = self._worker.canceled
+        self.diagnostics_ready = self._worker.diagnostics_ready
 
     def start(self) -> None:
+        self._pump_timer.start()
         self._thread.start()
 
     def cancel(self) -> None:
         """
         Request cancellation (best-effort). The solver must respect callbacks['should_cancel'].
         """
+        # Called directly rather than through a queued slot: the worker thread
+        # sits inside run_case and never returns to its event loop.
         try:
-            self._worker.cancel_requested.emit()
+            self._worker.request_cancel()
+            self._worker._log_batch.append("Cancel requested...")
         except Exception:
             pass
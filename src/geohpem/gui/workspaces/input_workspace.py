@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, Qt, QTimer, Signal  # type: ignore
+import re
+from collections import OrderedDict
+from typing import Any, Iterable
+
+import numpy as np
+from PySide6.QtCore import (  # type: ignore
+    QEvent,
+    QObject,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QCursor, QKeySequence, QShortcut  # type: ignore
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -21,19 +35,561 @@ from PySide6.QtWidgets import (
 )
 
 
-class InputWorkspace:
-    def __init__(self) -> None:
+# Qt classes are resolved once at import time (above); the signal holder is
+# defined once here too, so re-creating the workspace does not build a new
+# QObject subclass (and meta-object) per instance.
+class _Signals(QObject):
+    new_project_requested = Signal()
+    open_project_requested = Signal()
+    open_case_requested = Signal()
+    import_mesh_requested = Signal()
+    validate_requested = Signal()
+    run_requested = Signal()
+    switch_output_requested = Signal()
+    create_set_requested = Signal(object)  # payload dict
+    # Internal: background grid build finished (cache_key, vtk_mesh, grid).
+    grid_ready = Signal(object, object, object)
+
+
+# Status row styles; applied only when the state they reflect changes, since
+# every setStyleSheet() call re-polishes the label.
+_STYLE_SUBTLE = "color: #4b5563;"
+_STYLE_DIRTY = "color: #b91c1c; font-weight: 600;"
+_STYLE_CLEAN = "color: #065f46; font-weight: 600;"
+
+
+class _Slots(QObject):
+    """
+    Decorated slots for the workspace's widget connections (replaces
+    per-connection lambdas); each forwards to the owning InputWorkspace.
+    """
+
+    def __init__(self, ws: InputWorkspace) -> None:
+        super().__init__()
+        self._ws = ws
+
+    @Slot(int)
+    def on_set_changed(self, _index: int) -> None:
+        self._ws._set_change_timer.start()
+
+    def eventFilter(self, obj, event) -> bool:  # noqa: ANN001,N802
+        if event.type() == QEvent.Type.Show:
+            self._ws._on_shown()
+        return False
+
+    @Slot(object, object, object)
+    def on_grid_ready(self, key, vtk_mesh, grid) -> None:  # noqa: ANN001
+        self._ws._on_grid_ready(key, vtk_mesh, grid)
+
+    @Slot(bool)
+    def on_replace_toggled(self, on: bool) -> None:
+        self._ws._on_replace_toggled(on)
+
+    @Slot(bool)
+    def on_subtract_toggled(self, on: bool) -> None:
+        self._ws._on_subtract_toggled(on)
+
+    @Slot(bool)
+    def on_brush_toggled(self, on: bool) -> None:
+        self._ws._box_brush = bool(on)
+
+    @Slot()
+    def fit_view(self) -> None:
+        self._ws._fit_view()
+
+    @Slot()
+    def add_picked_node(self) -> None:
+        self._ws._add_picked_node()
+
+    @Slot()
+    def add_edge_from_last_two_picks(self) -> None:
+        self._ws._add_edge_from_last_two_picks()
+
+    @Slot()
+    def add_picked_cell(self) -> None:
+        self._ws._add_picked_cell()
+
+    @Slot()
+    def clear_selection(self) -> None:
+        self._ws._clear_selection()
+
+    @Slot()
+    def create_node_set(self) -> None:
+        self._ws._create_node_set_from_selection()
+
+    @Slot()
+    def create_edge_set(self) -> None:
+        self._ws._create_edge_set_from_selection()
+
+    @Slot()
+    def create_elem_set(self) -> None:
+        self._ws._create_elem_set_from_selection()
+
+    @Slot()
+    def toggle_box_nodes(self) -> None:
+        self._ws._toggle_box_select("node")
+
+    @Slot()
+    def toggle_box_cells(self) -> None:
+        self._ws._toggle_box_select("cell")
+
+    @Slot()
+    def boundary_all(self) -> None:
+        self._ws._select_boundary_edges("all")
+
+    @Slot()
+    def boundary_bottom(self) -> None:
+        self._ws._select_boundary_edges("bottom")
+
+    @Slot()
+    def boundary_top(self) -> None:
+        self._ws._select_boundary_edges("top")
+
+    @Slot()
+    def boundary_left(self) -> None:
+        self._ws._select_boundary_edges("left")
+
+    @Slot()
+    def boundary_right(self) -> None:
+        self._ws._select_boundary_edges("right")
+
+    @Slot()
+    def boundary_component(self) -> None:
+        self._ws._select_boundary_component_from_pick()
+
+    @Slot()
+    def toggle_polyline(self) -> None:
+        self._ws._toggle_polyline_mode()
+
+    @Slot()
+    def finish_polyline(self) -> None:
+        self._ws._finish_polyline_mode()
+
+    @Slot()
+    def clear_polyline(self) -> None:
+        self._ws._clear_polyline()
+
+    @Slot()
+    def invert_nodes(self) -> None:
+        self._ws._invert_nodes()
+
+    @Slot()
+    def invert_elems(self) -> None:
+        self._ws._invert_elems()
+
+    @Slot()
+    def invert_edges(self) -> None:
+        self._ws._invert_edges()
+
+    @Slot()
+    def cancel_interaction(self) -> None:
+        self._ws._cancel_active_interaction()
+
+    @Slot(object)
+    def preview_context_menu(self, pos) -> None:  # noqa: ANN001
+        self._ws._on_preview_context_menu_requested(pos)
+
+    @Slot()
+    def render_preview(self) -> None:
+        self._ws._render_preview()
+
+    @Slot()
+    def do_render_preview(self) -> None:
+        self._ws._do_render_preview()
+
+    @Slot()
+    def do_update_selection_ui(self) -> None:
+        self._ws._on_sel_ui_timer()
+
+
+# Set names end up in NPZ keys like "node_set__<name>", so no whitespace.
+_WHITESPACE_RE = re.compile(r"\s")
+
+_VTK: Any = None
+_PV: Any = None
+# Number of recently seen meshes whose VTK grids are kept (undo/redo, switching).
+_GRID_CACHE_SIZE = 4
+# Meshes with fewer cells convert to a VTK grid on the GUI thread (fast enough,
+# and a pick right after loading finds the grid ready).
+_ASYNC_GRID_MIN_CELLS = 50_000
+# Highlight datasets kept for recently shown sets (flipping the set combo).
+_HIGHLIGHT_CACHE_SIZE = 16
+
+
+def _vtk() -> Any:
+    """
+    Import vtk on first use and cache the result (False if unavailable).
+    """
+    global _VTK
+    if _VTK is None:
+        try:
+            import vtk  # type: ignore
 
-        class _Signals(QObject):
-            new_project_requested = Signal()
-            open_project_requested = Signal()
-            open_case_requested = Signal()
-            import_mesh_requested = Signal()
-            validate_requested = Signal()
-            run_requested = Signal()
-            switch_output_requested = Signal()
-            create_set_requested = Signal(object)  # payload dict
+            _VTK = vtk
+        except Exception:
+            _VTK = False
+    return _VTK
+
+
+def _pv() -> Any:
+    """
+    Import pyvista on first use and cache the result (False if unavailable).
+    """
+    global _PV
+    if _PV is None:
+        try:
+            import pyvista  # type: ignore
+
+            _PV = pyvista
+        except Exception:
+            _PV = False
+    return _PV
+
+
+# Above this many (id, set) entries, try the optional Numba CSR kernel.
+_MEMBERSHIP_CSR_MIN = 200_000
+# Cell type codes are tiny; box-pick grouping uses the same kernel below this.
+_GROUP_CODES_MAX = 1024
+
+
+def _membership_index(sets: dict[str, Any]) -> tuple[Any, ...] | None:
+    """
+    Build an inverted index over name -> id-array sets, so "which sets contain
+    id X" is a slice (CSR) or a binary search (sorted ids).
+
+    Returns (is_csr, indptr_or_sorted_ids, owner set index, set names).
+    """
+    names = [k for k, v in sets.items() if v.size]
+    if not names:
+        return None
+    arrays = [sets[k] for k in names]
+    lengths = np.fromiter((a.size for a in arrays), dtype=np.int64, count=len(arrays))
+    ids = np.concatenate(arrays)
+    owners = np.repeat(np.arange(len(names), dtype=np.int32), lengths)
+    if ids.size >= _MEMBERSHIP_CSR_MIN and int(ids.min()) >= 0:
+        from geohpem.viz._membership_jit import build_csr
+
+        csr = build_csr(ids, owners, int(ids.max()) + 1)
+        if csr is not None:
+            return True, csr[0], csr[1], names
+    # Stable sort keeps set order per id (same order as the mesh keys).
+    order = np.argsort(ids, kind="stable")
+    return False, ids[order], owners[order], names
+
+
+def _group_by_code(codes, lids) -> list[tuple[int, Any]]:  # noqa: ANN001
+    """
+    Split lids by their (small, non-negative) cell type code: [(code, lids)],
+    codes ascending, lids in input order.
+
+    Uses the optional Numba counting-sort kernel when available; otherwise a
+    stable argsort.
+    """
+    if not codes.size:
+        return []
+    lo, hi = int(codes.min()), int(codes.max())
+    if lo >= 0 and hi < _GROUP_CODES_MAX:
+        from geohpem.viz._membership_jit import build_csr
+
+        csr = build_csr(codes, lids, hi + 1)
+        if csr is not None:
+            indptr, grouped = csr
+            return [
+                (k, grouped[indptr[k] : indptr[k + 1]])
+                for k in np.flatnonzero(np.diff(indptr)).tolist()
+            ]
+    uniq, inv, counts = np.unique(codes, return_inverse=True, return_counts=True)
+    groups = np.split(lids[np.argsort(inv, kind="stable")], np.cumsum(counts)[:-1])
+    return list(zip(uniq.tolist(), groups))
+
+
+def _membership_lookup(index, key: int) -> list[str]:  # noqa: ANN001
+    if index is None:
+        return []
+    is_csr, keys, owners, names = index
+    if is_csr:
+        if not 0 <= key < keys.size - 1:
+            return []
+        lo, hi = int(keys[key]), int(keys[key + 1])
+    else:
+        lo = int(keys.searchsorted(key, side="left"))
+        hi = int(keys.searchsorted(key, side="right"))
+    return [names[i] for i in owners[lo:hi].tolist()]
+
+
+def _edge_lines(pairs, uniq):  # noqa: ANN001
+    """
+    Line connectivity as an (m, 2) int64 array for node-id pairs, with ids
+    remapped to positions in the sorted array `uniq`. Pairs with an end
+    outside `uniq` are dropped.
+    """
+    remap = np.searchsorted(uniq, pairs)
+    ok = remap < uniq.size
+    ok[ok] = uniq[remap[ok]] == pairs[ok]
+    return remap[ok.all(axis=1)].astype(np.int64, copy=False)
+
+
+def _line_polydata(pts, conn):  # noqa: ANN001
+    """
+    PolyData of 2-point line cells from an (m, 2) connectivity array.
+
+    The cells are handed to VTK as offsets/connectivity arrays without a copy
+    when pyvista supports it; otherwise via the legacy [2, i, j] lines array.
+    """
+    pv = _pv()
+    poly = pv.PolyData(pts)
+    ca_cls = getattr(pv, "CellArray", None)
+    try:
+        if hasattr(ca_cls, "from_regular_cells"):
+            poly.lines = ca_cls.from_regular_cells(conn, deep=False)
+            return poly
+        if hasattr(ca_cls, "from_arrays"):
+            flat = np.ascontiguousarray(conn).reshape(-1)
+            offsets = np.arange(0, flat.size + 1, 2, dtype=np.int64)
+            poly.lines = ca_cls.from_arrays(offsets, flat, deep=False)
+            return poly
+    except Exception:
+        pass
+    lines = np.empty((conn.shape[0], 3), dtype=np.int64)
+    lines[:, 0] = 2
+    lines[:, 1:] = conn
+    poly.lines = lines.reshape(-1)
+    return poly
+
+
+def _frustum_corners(planes) -> Any:  # noqa: ANN001
+    """
+    The 8 corners of a 6-plane vtkPlanes frustum (left, right, bottom, top,
+    near, far) as an (8, 4) homogeneous array, in the vertex order used by
+    vtkSelectionNode.FRUSTUM: index bit 2 = right, bit 1 = top, bit 0 = far.
+    """
+    normals = np.empty((6, 3), dtype=float)
+    offsets = np.empty((6,), dtype=float)
+    for i in range(6):
+        plane = planes.GetPlane(i)
+        n = np.asarray(plane.GetNormal(), dtype=float)
+        normals[i] = n
+        offsets[i] = float(n @ np.asarray(plane.GetOrigin(), dtype=float))
+    out = np.ones((8, 4), dtype=float)
+    for i in range(8):
+        rows = [(i >> 2) & 1, 2 + ((i >> 1) & 1), 4 + (i & 1)]
+        out[i, :3] = np.linalg.solve(normals[rows], offsets[rows])
+    return out
+
+
+def _frustum_cull(planes, centers, radii) -> Any:  # noqa: ANN001
+    """
+    Per-cell mask of bounding spheres not entirely outside any of the 6
+    frustum planes (conservative: kept cells may still miss the frustum).
+    """
+    inside = _frustum_corners(planes)[:, :3].mean(axis=0)
+    hit = np.ones(radii.shape, dtype=bool)
+    for i in range(6):
+        plane = planes.GetPlane(i)
+        n = np.asarray(plane.GetNormal(), dtype=float)
+        o = np.asarray(plane.GetOrigin(), dtype=float)
+        n = n / max(float(np.linalg.norm(n)), 1e-300)
+        # Orient each normal outward, whatever convention the picker used.
+        if n @ (inside - o) > 0:
+            n = -n
+        dist = centers @ n.astype(np.float32) - np.float32(n @ o)
+        hit &= dist <= radii
+    return hit
+
+
+def _frustum_key(planes) -> bytes | None:  # noqa: ANN001
+    """
+    Bytes of a vtkPlanes frustum's plane points and normals (None if unreadable).
+    """
+    try:
+        from vtk.util.numpy_support import vtk_to_numpy  # type: ignore
+
+        pts = vtk_to_numpy(planes.GetPoints().GetData())
+        nrm = vtk_to_numpy(planes.GetNormals())
+        return pts.tobytes() + nrm.tobytes()
+    except Exception:
+        return None
+
+
+def _get_array(ds, field: str, name: str) -> Any:  # noqa: ANN001
+    """
+    Named "point"/"cell" data array of a raw VTK dataset as a flat NumPy view,
+    or None if absent; avoids wrapping the dataset with pyvista per pick.
+    """
+    attrs = ds.GetPointData() if field == "point" else ds.GetCellData()
+    arr = attrs.GetArray(name) if attrs is not None else None
+    if arr is None:
+        return None
+    from vtk.util.numpy_support import vtk_to_numpy  # type: ignore
+
+    return vtk_to_numpy(arr).reshape(-1)
+
+
+def _in_range(ids, n: int):  # noqa: ANN001
+    """
+    Keep ids with 0 <= id < n (one mask, combined in place).
+    """
+    mask = ids >= 0
+    mask &= ids < n
+    return ids[mask]
+
+
+def _asi64(a):  # noqa: ANN001
+    """
+    `a` as an int64 ndarray; int64 arrays are returned as-is (no dtype coercion).
+    """
+    if isinstance(a, np.ndarray) and a.dtype == np.int64:
+        return a
+    return np.asarray(a).astype(np.int64, copy=False)
+
+
+class InputWorkspace:
+    # Fixed attribute set: no per-instance __dict__, and a mistyped attribute
+    # name fails loudly instead of silently creating a new one.
+    __slots__ = (
+        # bound-method callbacks (e.g. apply_2d_interaction) are held weakly
+        "__weakref__",
+        # signals
+        "_signals",
+        "_slots",
+        "new_project_requested",
+        "open_project_requested",
+        "open_case_requested",
+        "import_mesh_requested",
+        "validate_requested",
+        "run_requested",
+        "switch_output_requested",
+        "create_set_requested",
+        # widgets
+        "widget",
+        "_QMessageBox",
+        "_QInputDialog",
+        "_QMenu",
+        "_QCursor",
+        "_lbl_project",
+        "_lbl_solver",
+        "_lbl_dirty",
+        "_lbl_selection",
+        "_status_dirty",
+        "_btn_new",
+        "_btn_open_proj",
+        "_btn_open_case",
+        "_btn_import",
+        "_btn_validate",
+        "_btn_run",
+        "_btn_output",
+        "_tabs",
+        "_geometry_host",
+        "_geometry_host_layout",
+        "_geometry_placeholder",
+        "_combo_set",
+        "_btn_fit",
+        "_chk_box_replace",
+        "_chk_box_subtract",
+        "_chk_box_brush",
+        "_btn_box_nodes",
+        "_btn_box_cells",
+        "_btn_add_node",
+        "_btn_add_edge",
+        "_btn_add_cell",
+        "_btn_clear_sel",
+        "_sel_info",
+        "_lbl_sel_nodes",
+        "_lbl_sel_edges",
+        "_lbl_sel_elems",
+        "_btn_create_node_set",
+        "_btn_create_edge_set",
+        "_btn_create_elem_set",
+        "_btn_boundary_all",
+        "_btn_boundary_bottom",
+        "_btn_boundary_top",
+        "_btn_boundary_left",
+        "_btn_boundary_right",
+        "_btn_polyline",
+        "_btn_polyline_finish",
+        "_btn_polyline_clear",
+        "_btn_boundary_component",
+        "_viewer",
+        "_viewer_host",
+        "_viewer_host_layout",
+        "_viewer_unavailable",
+        "_mesh_tab_index",
+        "_sc_esc",
+        "_sc_clear",
+        "_sc_box_nodes",
+        "_sc_box_elems",
+        "_render_timer",
+        "_set_change_timer",
+        "_pending_reset_camera",
+        "_render_dirty",
+        "_base_grid",
+        "_highlight_actors",
+        "_sel_ui_dirty",
+        "_sel_ui_timer",
+        "_widget_state",
+        "_sel_ui_state",
+        # data / preview grid
+        "_request",
+        "_mesh",
+        "_mesh_sig",
+        "_vtk_mesh",
+        "_grid",
+        "_grid_points_np",
+        "_grid_n_points",
+        "_grid_n_cells",
+        "_point_locator",
+        "_frustum_filter",
+        "_grid_geom",
+        "_cell_spheres",
+        "_last_frustum_key",
+        "_point_kdtree",
+        "_cell_type_codes",
+        "_cell_local_ids",
+        "_grid_cache",
+        "_highlight_cache",
+        "_grid_build_key",
+        "_grid_build_points",
+        "_grid_build_failed_key",
+        # sets
+        "_set_label_by_key",
+        "_mesh_set_keys",
+        "_set_arrays",
+        "_node_set_arrays",
+        "_elem_set_arrays",
+        "_node_owner_index",
+        "_elem_owner_index",
+        "_n_tri",
+        # picking / selection
+        "_last_probe_pid",
+        "_last_probe_xy",
+        "_last_cell",
+        "_last_probe_pid_history",
+        "_box_mode",
+        "_box_replace",
+        "_box_brush",
+        "_box_subtract",
+        "_sel_nodes",
+        "_sel_nodes_arr",
+        "_sel_edges",
+        "_sel_elems",
+        "_suggest_edge_set_name",
+        "_pending_highlight_key",
+        "_last_set_cache",
+        "_normal_pick_enabled",
+        "_pick_cb",
+        "_cell_pick_cb",
+        "_is_2d_view",
+        # boundary helpers
+        "_boundary_edges",
+        "_boundary_adj",
+        "_boundary_nodes",
+        "_boundary_nodes_xy",
+        "_bbox_diag",
+        "_polyline_active",
+        "_polyline_nodes",
+    )
 
+    def __init__(self) -> None:
         self._signals = _Signals()
         self.new_project_requested = self._signals.new_project_requested
         self.open_project_requested = self._signals.open_project_requested
@@ -65,8 +621,9 @@ class InputWorkspace:
         self._lbl_dirty = QLabel("State: clean")
         self._lbl_selection = QLabel("Selection: -")
         self._lbl_project.setStyleSheet("font-weight: 600;")
-        self._lbl_solver.setStyleSheet("color: #4b5563;")
-        self._lbl_selection.setStyleSheet("color: #4b5563;")
+        self._lbl_solver.setStyleSheet(_STYLE_SUBTLE)
+        self._lbl_selection.setStyleSheet(_STYLE_SUBTLE)
+        self._status_dirty: bool | None = None
         sl.addWidget(self._lbl_project)
         sl.addWidget(self._lbl_solver)
         sl.addWidget(self._lbl_dirty)
@@ -255,6 +812,7 @@ class InputWorkspace:
         cl.addStretch(1)
 
         self._viewer = None
+        self._viewer_unavailable = False
         self._viewer_host = QWidget()
         self._viewer_host_layout = QVBoxLayout(self._viewer_host)
         self._viewer_host_layout.setContentsMargins(0, 0, 0, 0)
@@ -273,52 +831,51 @@ class InputWorkspace:
         self._tabs.addTab(preview, "Mesh Preview")
         self._mesh_tab_index = self._tabs.indexOf(preview)
 
-        # Wire buttons to signals
-        self._btn_new.clicked.connect(self.new_project_requested.emit)
-        self._btn_open_proj.clicked.connect(self.open_project_requested.emit)
-        self._btn_open_case.clicked.connect(self.open_case_requested.emit)
-        self._btn_import.clicked.connect(self.import_mesh_requested.emit)
-        self._btn_validate.clicked.connect(self.validate_requested.emit)
-        self._btn_run.clicked.connect(self.run_requested.emit)
-        self._btn_output.clicked.connect(self.switch_output_requested.emit)
-
-        self._btn_fit.clicked.connect(self._fit_view)
-        self._combo_set.currentIndexChanged.connect(lambda *_: self._render_preview())
-        self._btn_add_node.clicked.connect(self._add_picked_node)
-        self._btn_add_edge.clicked.connect(self._add_edge_from_last_two_picks)
-        self._btn_add_cell.clicked.connect(self._add_picked_cell)
-        self._btn_clear_sel.clicked.connect(self._clear_selection)
-        self._btn_create_node_set.clicked.connect(self._create_node_set_from_selection)
-        self._btn_create_edge_set.clicked.connect(self._create_edge_set_from_selection)
-        self._btn_create_elem_set.clicked.connect(self._create_elem_set_from_selection)
-        self._btn_box_nodes.clicked.connect(lambda: self._toggle_box_select("node"))
-        self._btn_box_cells.clicked.connect(lambda: self._toggle_box_select("cell"))
-        self._btn_boundary_all.clicked.connect(
-            lambda: self._select_boundary_edges("all")
-        )
-        self._btn_boundary_bottom.clicked.connect(
-            lambda: self._select_boundary_edges("bottom")
-        )
-        self._btn_boundary_top.clicked.connect(
-            lambda: self._select_boundary_edges("top")
-        )
-        self._btn_boundary_left.clicked.connect(
-            lambda: self._select_boundary_edges("left")
-        )
-        self._btn_boundary_right.clicked.connect(
-            lambda: self._select_boundary_edges("right")
-        )
-        self._btn_polyline.clicked.connect(self._toggle_polyline_mode)
-        self._btn_polyline_finish.clicked.connect(self._finish_polyline_mode)
-        self._btn_polyline_clear.clicked.connect(self._clear_polyline)
-        self._btn_boundary_component.clicked.connect(
-            self._select_boundary_component_from_pick
-        )
+        # Wire buttons to signals. Signal-to-signal connections are relayed by
+        # Qt itself, without calling back into Python for .emit.
+        for btn, sig in (
+            (self._btn_new, self.new_project_requested),
+            (self._btn_open_proj, self.open_project_requested),
+            (self._btn_open_case, self.open_case_requested),
+            (self._btn_import, self.import_mesh_requested),
+            (self._btn_validate, self.validate_requested),
+            (self._btn_run, self.run_requested),
+            (self._btn_output, self.switch_output_requested),
+        ):
+            btn.clicked.connect(sig)
+
+        slots = self._slots = _Slots(self)
+        self._signals.grid_ready.connect(slots.on_grid_ready)
+        self._combo_set.currentIndexChanged.connect(slots.on_set_changed)
+        for btn, slot in (
+            (self._btn_fit, slots.fit_view),
+            (self._btn_add_node, slots.add_picked_node),
+            (self._btn_add_edge, slots.add_edge_from_last_two_picks),
+            (self._btn_add_cell, slots.add_picked_cell),
+            (self._btn_clear_sel, slots.clear_selection),
+            (self._btn_create_node_set, slots.create_node_set),
+            (self._btn_create_edge_set, slots.create_edge_set),
+            (self._btn_create_elem_set, slots.create_elem_set),
+            (self._btn_box_nodes, slots.toggle_box_nodes),
+            (self._btn_box_cells, slots.toggle_box_cells),
+            (self._btn_boundary_all, slots.boundary_all),
+            (self._btn_boundary_bottom, slots.boundary_bottom),
+            (self._btn_boundary_top, slots.boundary_top),
+            (self._btn_boundary_left, slots.boundary_left),
+            (self._btn_boundary_right, slots.boundary_right),
+            (self._btn_polyline, slots.toggle_polyline),
+            (self._btn_polyline_finish, slots.finish_polyline),
+            (self._btn_polyline_clear, slots.clear_polyline),
+            (self._btn_boundary_component, slots.boundary_component),
+        ):
+            btn.clicked.connect(slot)
 
         # Selection op sanity: Subtract overrides Replace (mutually exclusive).
+        # The toggled slots also keep the cached _box_* flags read by picking.
         try:
-            self._chk_box_subtract.toggled.connect(self._on_subtract_toggled)
-            self._chk_box_replace.toggled.connect(self._on_replace_toggled)
+            self._chk_box_subtract.toggled.connect(slots.on_subtract_toggled)
+            self._chk_box_replace.toggled.connect(slots.on_replace_toggled)
+            self._chk_box_brush.toggled.connect(slots.on_brush_toggled)
         except Exception:
             pass
 
@@ -327,22 +884,61 @@ class InputWorkspace:
         self._mesh_sig = None
         self._vtk_mesh = None
         self._grid = None
+        # Plain views of the current grid, refreshed by _set_grid().
+        self._grid_points_np = None
+        self._grid_n_points = 0
+        self._grid_n_cells = 0
+        self._point_locator = None  # vtkStaticPointLocator, built on first pick
+        self._frustum_filter = None  # (filter, selection node) bound to the grid
+        self._grid_geom = None  # array-free shallow copy of the grid (highlights)
+        self._cell_spheres = None  # (centroids, radii) float32 for frustum culling
+        # Brush pick key of the last box pick, to skip identical re-picks;
+        # cleared by any other selection change.
+        self._last_frustum_key: tuple[Any, ...] | None = None
+        self._point_kdtree = None  # scipy cKDTree over grid points (False: n/a)
+        # Per-cell (type code, local id) arrays of the grid, for pick lookups.
+        self._cell_type_codes = None
+        self._cell_local_ids = None
+        # (signature, id(points)) -> (points, vtk_mesh, grid), most recent last.
+        self._grid_cache: OrderedDict[tuple[Any, int], tuple[Any, Any, Any]] = (
+            OrderedDict()
+        )
+        # set key -> (mesh set array, highlight dataset) for the current grid.
+        self._highlight_cache: OrderedDict[str, tuple[Any, Any]] = OrderedDict()
+        # Cache key of the grid being built on the thread pool / last failed build.
+        self._grid_build_key: tuple[Any, int] | None = None
+        self._grid_build_points = None  # points array of the mesh being built
+        self._grid_build_failed_key: tuple[Any, int] | None = None
         self._set_label_by_key = {}
-        self._node_set_membership = {}
-        self._elem_set_membership = {}
+        # (mesh, (node_keys, edge_keys, elem_keys)) for the last mesh seen.
+        self._mesh_set_keys = None
+        # Raw set id arrays; the inverted "id -> sets" indexes are built lazily
+        # on the first probe/pick (see _node_membership_for/_elem_membership_for).
+        # mesh set key -> int64 id array (edges as (n, 2)), built in _rebuild_sets.
+        self._set_arrays: dict[str, Any] = {}
+        self._node_set_arrays: dict[str, Any] = {}
+        self._elem_set_arrays: dict[str, dict[str, Any]] = {}
+        self._node_owner_index = None
+        self._elem_owner_index: dict[str, Any] = {}
         self._n_tri = 0
         self._last_probe_pid = None
         self._last_probe_xy: tuple[float, float] | None = None
         self._last_cell = None  # (cell_type, local_id)
         self._last_probe_pid_history: list[int] = []
         self._box_mode: str | None = None  # None|'node'|'cell'
+        # Mirrors of the Replace/Subtract/Brush checkboxes (kept by toggled slots).
         self._box_replace: bool = False
+        self._box_subtract: bool = False
         self._box_brush: bool = False
         self._sel_nodes: set[int] = set()
+        # Sorted int64 copy of _sel_nodes; None when stale (see _selected_nodes_array).
+        self._sel_nodes_arr = None
         self._sel_edges: set[tuple[int, int]] = set()
         self._sel_elems: dict[str, set[int]] = {}
         self._suggest_edge_set_name: str | None = None
         self._pending_highlight_key: str | None = None
+        # kind -> (selection snapshot, sorted payload) of the last created set.
+        self._last_set_cache: dict[str, tuple[frozenset, list]] = {}
         self._boundary_edges = None
         self._boundary_adj = None
         self._boundary_nodes = None
@@ -355,32 +951,58 @@ class InputWorkspace:
         self._cell_pick_cb = None
         self._is_2d_view = True
 
+        # Render requests within one frame (~16 ms) are coalesced into one pass.
+        self._pending_reset_camera = False
+        self._render_timer = QTimer(self.widget)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(16)
+        self._render_timer.timeout.connect(slots.do_render_preview)
+        # Highlight-set changes are debounced: scrolling through the combo with
+        # the arrow keys renders only the set the user settles on.
+        self._set_change_timer = QTimer(self.widget)
+        self._set_change_timer.setSingleShot(True)
+        self._set_change_timer.setInterval(80)
+        self._set_change_timer.timeout.connect(slots.render_preview)
+        # Work requested while hidden is deferred until the widgets are shown.
+        self._render_dirty = False
+        # Grid currently drawn as the base actor; highlight-only changes keep it
+        # and swap just the actors in _highlight_actors.
+        self._base_grid = None
+        self._highlight_actors: list[Any] = []
+        self._sel_ui_dirty = False
+        self.widget.installEventFilter(self._slots)
+        self._viewer_host.installEventFilter(self._slots)
+
+        # Selection labels/buttons are refreshed at most ~30 times per second.
+        self._widget_state: dict[tuple[Any, str], Any] = {}
+        self._sel_ui_state: tuple[Any, ...] | None = None
+        self._sel_ui_timer = QTimer(self.widget)
+        self._sel_ui_timer.setSingleShot(True)
+        self._sel_ui_timer.setInterval(33)
+        self._sel_ui_timer.timeout.connect(slots.do_update_selection_ui)
+
         self.set_status(project=None, dirty=False, solver="fake")
-        self._update_selection_ui()
+        self._do_update_selection_ui()
 
         # Shortcuts (Input workspace scope)
         try:
             self._sc_esc = QShortcut(QKeySequence("Esc"), self.widget)
-            self._sc_esc.activated.connect(self._cancel_active_interaction)
+            self._sc_esc.activated.connect(slots.cancel_interaction)
         except Exception:
             self._sc_esc = None
         try:
             self._sc_clear = QShortcut(QKeySequence("C"), self.widget)
-            self._sc_clear.activated.connect(self._clear_selection)
+            self._sc_clear.activated.connect(slots.clear_selection)
         except Exception:
             self._sc_clear = None
         try:
             self._sc_box_nodes = QShortcut(QKeySequence("B"), self.widget)
-            self._sc_box_nodes.activated.connect(
-                lambda: self._toggle_box_select("node")
-            )
+            self._sc_box_nodes.activated.connect(slots.toggle_box_nodes)
         except Exception:
             self._sc_box_nodes = None
         try:
             self._sc_box_elems = QShortcut(QKeySequence("Shift+B"), self.widget)
-            self._sc_box_elems.activated.connect(
-                lambda: self._toggle_box_select("cell")
-            )
+            self._sc_box_elems.activated.connect(slots.toggle_box_cells)
         except Exception:
             self._sc_box_elems = None
 
@@ -432,11 +1054,11 @@ class InputWorkspace:
             self._lbl_project.setToolTip(project)
         self._lbl_project.setText(f"Project: {label}")
         self._lbl_solver.setText(f"Solver: {solver or 'fake'}")
-        self._lbl_dirty.setText("State: dirty" if dirty else "State: clean")
-        if dirty:
-            self._lbl_dirty.setStyleSheet("color: #b91c1c; font-weight: 600;")
-        else:
-            self._lbl_dirty.setStyleSheet("color: #065f46; font-weight: 600;")
+        dirty = bool(dirty)
+        if dirty != self._status_dirty:
+            self._status_dirty = dirty
+            self._lbl_dirty.setText("State: dirty" if dirty else "State: clean")
+            self._lbl_dirty.setStyleSheet(_STYLE_DIRTY if dirty else _STYLE_CLEAN)
 
         has_project = bool(project)
         self._btn_import.setEnabled(has_project)
@@ -448,15 +1070,20 @@ class InputWorkspace:
         """
         Update the preview from in-memory project data (best-effort).
         """
+        prev_mesh = self._mesh
         self._request = request
         self._mesh = mesh
 
-        sig = self._compute_mesh_signature(mesh)
+        # Mesh edits produce a new dict (see domain.mesh_ops), so the same
+        # object means the same topology; skip rescanning its sets.
+        if mesh is prev_mesh and self._mesh_sig is not None:
+            sig = self._mesh_sig
+        else:
+            sig = self._compute_mesh_signature(mesh)
         mesh_changed = sig != self._mesh_sig
         self._mesh_sig = sig
         if mesh_changed:
-            self._vtk_mesh = None
-            self._grid = None
+            self._set_grid(*self._cached_grid(mesh))
             self._boundary_edges = None
             self._boundary_adj = None
             self._boundary_nodes = None
@@ -466,7 +1093,12 @@ class InputWorkspace:
             self._polyline_nodes = []
 
         self._rebuild_sets()
-        self._ensure_viewer()
+        # The VTK viewer (render window + GL context) is created the first time
+        # the preview is actually on screen; until then the render stays pending.
+        if self._viewer_host.isVisible():
+            self._ensure_viewer()
+        else:
+            self._render_dirty = True
         self._render_preview(reset_camera=mesh_changed)
         self._update_selection_ui()
 
@@ -475,9 +1107,9 @@ class InputWorkspace:
         if v is None:
             return
         try:
-            import vtk  # type: ignore
-
-            vtk.vtkObject.GlobalWarningDisplayOff()
+            vtk = _vtk()
+            if vtk:
+                vtk.vtkObject.GlobalWarningDisplayOff()
         except Exception:
             pass
         try:
@@ -499,16 +1131,19 @@ class InputWorkspace:
         except Exception:
             pass
         self._viewer = None
-        self._vtk_mesh = None
-        self._grid = None
+        self._base_grid = None
+        self._highlight_actors = []
+        self._set_grid(None, None)
+        self._grid_cache.clear()
         self._mesh_sig = None
 
     def _ensure_viewer(self) -> None:
-        if self._viewer is not None:
+        if self._viewer is not None or self._viewer_unavailable:
             return
         try:
             from pyvistaqt import QtInteractor  # type: ignore
         except Exception:
+            self._viewer_unavailable = True
             self._viewer_host_layout.addWidget(
                 QLabel("PyVistaQt not installed. Install pyvista + pyvistaqt.")
             )
@@ -521,7 +1156,7 @@ class InputWorkspace:
         try:
             self._viewer.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
             self._viewer.customContextMenuRequested.connect(
-                self._on_preview_context_menu_requested
+                self._slots.preview_context_menu
             )
         except Exception:
             pass
@@ -618,6 +1253,34 @@ class InputWorkspace:
         except Exception:
             pass
 
+    def _set_keys_for(
+        self, mesh
+    ) -> tuple[list[str], list[str], list[str]]:  # noqa: ANN001
+        """
+        (node, edge, elem) set keys of `mesh`, bucketed in one pass over its keys
+        and reused by the signature and _rebuild_sets for the same mesh object.
+        """
+        hit = self._mesh_set_keys
+        if hit is not None and hit[0] is mesh:
+            return hit[1]
+        # Most keys are large numeric arrays, not sets.
+        node_keys: list[str] = []
+        edge_keys: list[str] = []
+        elem_keys: list[str] = []
+        by_prefix = {
+            "node_set__": node_keys,
+            "edge_set__": edge_keys,
+            "elem_set__": elem_keys,
+        }
+        for k in mesh.keys():
+            if isinstance(k, str):
+                bucket = by_prefix.get(k[:10])
+                if bucket is not None:
+                    bucket.append(k)
+        keys = (node_keys, edge_keys, elem_keys)
+        self._mesh_set_keys = (mesh, keys)
+        return keys
+
     def _compute_mesh_signature(
         self, mesh
     ) -> tuple[int, int, int, int] | None:  # noqa: ANN001
@@ -628,8 +1291,6 @@ class InputWorkspace:
         if not isinstance(mesh, dict):
             return None
         try:
-            import numpy as np
-
             pts = np.asarray(mesh.get("points", []))
             n_points = int(pts.shape[0]) if pts.ndim == 2 else int(pts.size)
             tri = np.asarray(mesh.get("cells_tri3", []))
@@ -638,13 +1299,12 @@ class InputWorkspace:
             n_quad = int(quad.shape[0]) if quad.ndim == 2 else int(quad.size)
             # edge sets are optional; include total pair count as a coarse signal
             n_edge_pairs = 0
-            for k, v in mesh.items():
-                if isinstance(k, str) and k.startswith("edge_set__"):
-                    arr = np.asarray(v)
-                    if arr.ndim >= 2:
-                        n_edge_pairs += int(arr.shape[0])
-                    else:
-                        n_edge_pairs += int(arr.size // 2)
+            for k in self._set_keys_for(mesh)[1]:
+                arr = np.asarray(mesh[k])
+                if arr.ndim >= 2:
+                    n_edge_pairs += int(arr.shape[0])
+                else:
+                    n_edge_pairs += int(arr.size // 2)
             return (n_points, n_tri, n_quad, n_edge_pairs)
         except Exception:
             return None
@@ -653,18 +1313,17 @@ class InputWorkspace:
         keep_key = str(self._combo_set.currentData() or "")
         preferred = self._pending_highlight_key
 
-        self._combo_set.blockSignals(True)
-        self._combo_set.clear()
-        self._combo_set.addItem("(None)", "")
-
         self._set_label_by_key = {}
-        self._node_set_membership = {}
-        self._elem_set_membership = {}
+        self._set_arrays = {}
+        self._node_set_arrays = {}
+        self._elem_set_arrays = {}
+        self._node_owner_index = None
+        self._elem_owner_index = {}
         self._n_tri = 0
 
         mesh = self._mesh
         if not isinstance(mesh, dict):
-            self._combo_set.blockSignals(False)
+            self._fill_set_combo([], "")
             return
 
         # optional labels from request.sets_meta
@@ -672,16 +1331,11 @@ class InputWorkspace:
         if isinstance(req, dict):
             sm = req.get("sets_meta")
             if isinstance(sm, dict):
-                for k, v in sm.items():
-                    if (
-                        isinstance(k, str)
-                        and isinstance(v, dict)
-                        and isinstance(v.get("label"), str)
-                    ):
-                        self._set_label_by_key[k] = str(v["label"])
-
-        def label_for_key(k: str) -> str:
-            return self._set_label_by_key.get(k) or k
+                self._set_label_by_key = {
+                    k: v["label"]
+                    for k, v in sm.items()
+                    if isinstance(v, dict) and isinstance(v.get("label"), str)
+                }
 
         # counts for mapping element local_id -> vtk cell id
         try:
@@ -689,43 +1343,166 @@ class InputWorkspace:
         except Exception:
             self._n_tri = 0
 
-        for k in sorted(mesh.keys()):
-            if k.startswith(("node_set__", "edge_set__", "elem_set__")):
-                self._combo_set.addItem(label_for_key(k), k)
-
-        # membership
-        import numpy as np
+        node_keys, edge_keys, elem_keys = self._set_keys_for(mesh)
 
-        for k, arr in mesh.items():
-            if not isinstance(k, str):
+        # Canonical int64 arrays, converted once here and reused by highlighting;
+        # membership keeps them as-is and builds its indexes on demand.
+        arrays = self._set_arrays
+        for k in node_keys:
+            nodes = _asi64(mesh[k]).reshape(-1)
+            arrays[k] = nodes
+            self._node_set_arrays[k[10:]] = nodes
+        for k in edge_keys:
+            try:
+                arrays[k] = _asi64(mesh[k]).reshape(-1, 2)
+            except Exception:
+                pass
+        for k in elem_keys:
+            ids = _asi64(mesh[k]).reshape(-1)
+            arrays[k] = ids
+            # elem_set__NAME__tri3
+            parts = k[10:].split("__")
+            if len(parts) < 2:
                 continue
-            if k.startswith("node_set__"):
-                name = k.split("__", 1)[1]
-                nodes = np.asarray(arr, dtype=np.int64).reshape(-1)
-                for nid in nodes:
-                    self._node_set_membership.setdefault(int(nid), []).append(name)
-            if k.startswith("elem_set__"):
-                # elem_set__NAME__tri3
-                rest = k.split("__", 1)[1]
-                parts = rest.split("__")
-                if len(parts) < 2:
-                    continue
-                name = parts[0]
-                cell_type = parts[1]
-                ids = np.asarray(arr, dtype=np.int64).reshape(-1)
-                by_id = self._elem_set_membership.setdefault(cell_type, {})
-                for cid in ids:
-                    by_id.setdefault(int(cid), []).append(name)
+            name = parts[0]
+            cell_type = parts[1]
+            self._elem_set_arrays.setdefault(cell_type, {})[name] = ids
 
         # Restore preferred selection (newly created) or previous selection if possible.
-        target = preferred or keep_key
-        if target:
-            for i in range(self._combo_set.count()):
-                if str(self._combo_set.itemData(i) or "") == target:
-                    self._combo_set.setCurrentIndex(i)
-                    break
+        self._fill_set_combo(
+            sorted(node_keys + edge_keys + elem_keys), preferred or keep_key
+        )
         self._pending_highlight_key = None
-        self._combo_set.blockSignals(False)
+
+    def _fill_set_combo(self, keys: list[str], target: str) -> None:
+        """
+        Repopulate the highlight combo in one batch (signals blocked, updates held).
+        """
+        combo = self._combo_set
+        labels = self._set_label_by_key
+        # Repaints are held until the combo is refilled. The model's own signals
+        # stay live: the popup view tracks rows through them.
+        combo.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(combo):
+                combo.clear()
+                combo.addItems(["(None)"] + [labels.get(k) or k for k in keys])
+                combo.setItemData(0, "")
+                for i, k in enumerate(keys, 1):
+                    combo.setItemData(i, k)
+                if target:
+                    i = combo.findData(target)
+                    if i >= 0:
+                        combo.setCurrentIndex(i)
+        finally:
+            combo.setUpdatesEnabled(True)
+
+    def _node_membership_for(self, pid: int) -> list[str]:
+        if self._node_owner_index is None and self._node_set_arrays:
+            self._node_owner_index = _membership_index(self._node_set_arrays)
+        return _membership_lookup(self._node_owner_index, int(pid))
+
+    def _elem_membership_for(self, cell_type: str, local_id: int) -> list[str]:
+        sets = self._elem_set_arrays.get(cell_type)
+        if not sets:
+            return []
+        if cell_type not in self._elem_owner_index:
+            self._elem_owner_index[cell_type] = _membership_index(sets)
+        return _membership_lookup(self._elem_owner_index[cell_type], int(local_id))
+
+    def _grid_cache_key(self, mesh) -> tuple[Any, int] | None:  # noqa: ANN001
+        # The signature only holds counts, so the points array identity is part
+        # of the key: a cached grid is reused only for the very same mesh data.
+        if self._mesh_sig is None or not isinstance(mesh, dict):
+            return None
+        pts = mesh.get("points")
+        if pts is None:
+            return None
+        return (self._mesh_sig, id(pts))
+
+    def _cached_grid(self, mesh) -> tuple[Any, Any]:  # noqa: ANN001
+        key = self._grid_cache_key(mesh)
+        hit = self._grid_cache.get(key) if key is not None else None
+        if hit is None or hit[0] is not mesh.get("points"):
+            return None, None
+        self._grid_cache.move_to_end(key)
+        return hit[1], hit[2]
+
+    def _set_grid(self, vtk_mesh, grid) -> None:  # noqa: ANN001
+        self._vtk_mesh = vtk_mesh
+        self._grid = grid
+        self._point_locator = None
+        self._frustum_filter = None
+        self._grid_geom = None
+        self._cell_spheres = None
+        self._last_frustum_key = None
+        self._point_kdtree = None
+        self._highlight_cache.clear()
+        self._cell_type_codes = None
+        self._cell_local_ids = None
+        if grid is None:
+            self._grid_points_np = None
+            self._grid_n_points = 0
+            self._grid_n_cells = 0
+            return
+        self._grid_points_np = np.asarray(grid.points)
+        self._grid_n_points = int(grid.n_points)
+        self._grid_n_cells = int(grid.n_cells)
+        try:
+            cd = grid.cell_data
+            if "__cell_type_code" in cd and "__cell_local_id" in cd:
+                # int64 once per grid, so pick gathers need no per-pick casts.
+                self._cell_type_codes = _asi64(cd["__cell_type_code"])
+                self._cell_local_ids = _asi64(cd["__cell_local_id"])
+        except Exception:
+            pass
+
+    def _closest_point(self, grid, xyz) -> int:  # noqa: ANN001
+        """
+        Closest grid point id; the point locator is built once per grid.
+        """
+        loc = self._point_locator
+        if loc is None:
+            vtk = _vtk()
+            if vtk and hasattr(vtk, "vtkStaticPointLocator"):
+                try:
+                    loc = vtk.vtkStaticPointLocator()
+                    loc.SetDataSet(grid)
+                    loc.BuildLocator()
+                except Exception:
+                    loc = False
+            else:
+                loc = False
+            self._point_locator = loc
+        if loc:
+            return int(loc.FindClosestPoint(xyz))
+        return int(grid.find_closest_point(xyz))
+
+    def _closest_points(self, grid, pts):  # noqa: ANN001
+        """
+        Closest grid point ids for an (M, 3) array, as one batched query.
+
+        Uses a cKDTree built once per grid when scipy is available; otherwise
+        falls back to the per-point locator.
+        """
+        pts = np.asarray(pts, dtype=float).reshape(-1, 3)
+        tree = self._point_kdtree
+        if tree is None:
+            try:
+                from scipy.spatial import cKDTree  # type: ignore
+
+                tree = cKDTree(self._grid_points_np)
+            except Exception:
+                tree = False
+            self._point_kdtree = tree
+        if tree:
+            _, ids = tree.query(pts, k=1)
+            return np.asarray(ids, dtype=np.int64).reshape(-1)
+        return np.fromiter(
+            (self._closest_point(grid, tuple(p)) for p in pts),
+            dtype=np.int64,
+            count=pts.shape[0],
+        )
 
     def _ensure_grid(self):  # noqa: ANN001
         if self._grid is not None:
@@ -735,19 +1512,130 @@ class InputWorkspace:
             return None, False
         from geohpem.viz.vtk_convert import contract_mesh_to_pyvista
 
-        self._vtk_mesh = contract_mesh_to_pyvista(mesh)
-        self._grid = self._vtk_mesh.grid
+        vtk_mesh, grid = self._cached_grid(mesh)
+        if grid is not None:
+            self._set_grid(vtk_mesh, grid)
+            return grid, True
+        vtk_mesh = contract_mesh_to_pyvista(mesh)
+        self._set_grid(vtk_mesh, vtk_mesh.grid)
+        self._remember_grid(self._grid_cache_key(mesh), mesh["points"])
         return self._grid, True
 
+    def _remember_grid(
+        self, key, points, vtk_mesh=None, grid=None  # noqa: ANN001
+    ) -> None:
+        """
+        Store a grid (default: the current one) in the LRU under key.
+        """
+        if key is None:
+            return
+        if grid is None:
+            vtk_mesh, grid = self._vtk_mesh, self._grid
+        self._grid_cache[key] = (points, vtk_mesh, grid)
+        self._grid_cache.move_to_end(key)
+        while len(self._grid_cache) > _GRID_CACHE_SIZE:
+            self._grid_cache.popitem(last=False)
+
+    def _start_grid_build(self) -> bool:
+        """
+        Convert the current mesh to a VTK grid on the thread pool.
+
+        Returns True while a build for the current mesh is pending; False if
+        the caller should build synchronously (no cache key, a small mesh, or
+        the background build already failed for this mesh).
+        """
+        mesh = self._mesh
+        key = self._grid_cache_key(mesh)
+        if key is None or key == self._grid_build_failed_key:
+            return False
+        sig = key[0]
+        if sig[1] + sig[2] < _ASYNC_GRID_MIN_CELLS:
+            return False
+        if key == self._grid_build_key:
+            return True
+        self._grid_build_key = key
+        self._grid_build_points = mesh.get("points")
+        ready = self._signals.grid_ready
+
+        def task() -> None:
+            try:
+                from geohpem.viz.vtk_convert import contract_mesh_to_pyvista
+
+                vtk_mesh = contract_mesh_to_pyvista(mesh)
+                grid = vtk_mesh.grid
+            except Exception:
+                vtk_mesh, grid = None, None
+            ready.emit(key, vtk_mesh, grid)
+
+        QThreadPool.globalInstance().start(task)
+        return True
+
+    def _on_grid_ready(self, key, vtk_mesh, grid) -> None:  # noqa: ANN001
+        if key != self._grid_build_key:
+            return
+        self._grid_build_key = None
+        points, self._grid_build_points = self._grid_build_points, None
+        if self._viewer is None:
+            return  # shut down meanwhile
+        if key != self._grid_cache_key(self._mesh):
+            # The user moved on to another mesh; keep the finished grid in the
+            # LRU so switching back to this one does not convert it again.
+            if grid is not None and points is not None and key not in self._grid_cache:
+                self._remember_grid(key, points, vtk_mesh, grid)
+            return
+        if grid is None:
+            # Build synchronously on the next render to surface the error.
+            self._grid_build_failed_key = key
+        elif self._grid is None and key not in self._grid_cache:
+            self._set_grid(vtk_mesh, grid)
+            self._remember_grid(key, points)
+        # Otherwise a synchronous build (e.g. a pick) got there first; the
+        # render below picks up that grid and this one is dropped.
+        self._render_preview(reset_camera=True)
+
     def _render_preview(self, *, reset_camera: bool = False) -> None:
+        """
+        Schedule a preview render; repeated calls before it runs collapse into one.
+        """
+        self._pending_reset_camera = self._pending_reset_camera or bool(reset_camera)
+        if not self._viewer_host.isVisible():
+            # Hidden (e.g. results streaming in while another workspace is
+            # shown): no timer tick at all; _on_shown renders once on return.
+            self._render_dirty = True
+            return
+        # Keep the pending deadline: restarting it would let a steady stream of
+        # brush picks postpone the render indefinitely.
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _on_shown(self) -> None:
+        if self._render_dirty and self._viewer_host.isVisible():
+            self._render_dirty = False
+            self._ensure_viewer()
+            self._render_preview()
+        if self._sel_ui_dirty and self.widget.isVisible():
+            self._sel_ui_dirty = False
+            self._update_selection_ui()
+
+    def _do_render_preview(self) -> None:
         if self._viewer is None:
             return
+        if not self._viewer_host.isVisible():
+            # Another workspace/tab is shown; render once when it comes back
+            # (the pending camera reset is kept until then).
+            self._render_dirty = True
+            return
+        reset_camera, self._pending_reset_camera = self._pending_reset_camera, False
         mesh = self._mesh
         if not isinstance(mesh, dict) or "points" not in mesh:
-            self._viewer.clear()
+            self._clear_scene()
             self._sel_info.setText("No mesh loaded.")
             self._viewer.render()
             return
+        # Large meshes: convert off the GUI thread; grid_ready re-renders.
+        if self._grid is None and self._start_grid_build():
+            self._sel_info.setText("Loading mesh preview...")
+            return
         try:
             grid, is_new_grid = self._ensure_grid()
             if grid is None:
@@ -759,21 +1647,27 @@ class InputWorkspace:
                     cam = getattr(self._viewer, "camera_position", None)
                 except Exception:
                     cam = None
-            self._viewer.clear()
-            self._viewer.add_mesh(
-                grid,
-                show_edges=True,
-                color="#F2F2F2",
-                edge_color="#888888",
-                line_width=1,
-            )
+            if grid is self._base_grid:
+                self._remove_highlights()
+            else:
+                self._clear_scene()
+                # render=False throughout: the scene is drawn once, at the end.
+                self._viewer.add_mesh(
+                    grid,
+                    show_edges=True,
+                    color="#F2F2F2",
+                    edge_color="#888888",
+                    line_width=1,
+                    render=False,
+                )
+                self._base_grid = grid
 
             key = str(self._combo_set.currentData() or "")
             if key:
                 self._highlight_set(mesh, grid, key)
             self._highlight_selection(mesh, grid)
             if reset_camera or is_new_grid:
-                self._viewer.reset_camera()
+                self._viewer.reset_camera(render=False)
             elif cam is not None:
                 try:
                     self._viewer.camera_position = cam  # type: ignore[attr-defined]
@@ -784,132 +1678,198 @@ class InputWorkspace:
                 "Pick: click node/cell to inspect; choose a set to highlight."
             )
         except Exception as exc:
-            self._viewer.clear()
+            self._clear_scene()
             self._sel_info.setText(f"Preview failed: {exc}")
             try:
                 self._viewer.render()
             except Exception:
                 pass
 
-    def _highlight_set(self, mesh, grid, key: str) -> None:  # noqa: ANN001
-        import numpy as np
-        import pyvista as pv  # type: ignore
+    def _clear_scene(self) -> None:
+        self._viewer.clear()
+        self._base_grid = None
+        self._highlight_actors = []
 
+    def _remove_highlights(self) -> None:
+        actors, self._highlight_actors = self._highlight_actors, []
+        for actor in actors:
+            try:
+                self._viewer.remove_actor(actor, reset_camera=False, render=False)
+            except Exception:
+                pass
+
+    def _add_highlight(self, data, **kwargs) -> None:  # noqa: ANN001
+        actor = self._viewer.add_mesh(data, render=False, **kwargs)
+        if actor is not None:
+            self._highlight_actors.append(actor)
+
+    def _highlight_set(self, mesh, grid, key: str) -> None:  # noqa: ANN001
+        # Mesh edits copy the dict but keep untouched set arrays, so the
+        # source array's identity tells whether a cached dataset is current.
+        src = mesh.get(key)
+        cache = self._highlight_cache
+        hit = cache.get(key)
+        if hit is not None and hit[0] is src:
+            cache.move_to_end(key)
+            data = hit[1]
+        else:
+            data = self._set_highlight_data(mesh, grid, key)
+            cache[key] = (src, data)
+            while len(cache) > _HIGHLIGHT_CACHE_SIZE:
+                cache.popitem(last=False)
+        if data is None:
+            return
         if key.startswith("node_set__"):
-            nodes = np.asarray(mesh.get(key, []), dtype=np.int64).reshape(-1)
-            if nodes.size:
-                nodes = nodes[(nodes >= 0) & (nodes < int(grid.n_points))]
-                if nodes.size == 0:
-                    return
-                pts = np.asarray(grid.points)[nodes]
-                pd = pv.PolyData(pts)
-                self._viewer.add_mesh(
-                    pd, color="#D00000", point_size=14, render_points_as_spheres=False
+            self._add_highlight(
+                data, color="#D00000", point_size=14, render_points_as_spheres=False
+            )
+        elif key.startswith("edge_set__"):
+            self._add_highlight(data, color="#D00000", line_width=4)
+        else:
+            # Make it very visible over the base mesh: thick wireframe + semi-transparent fill.
+            try:
+                self._add_highlight(
+                    data, style="wireframe", color="#D00000", line_width=5
                 )
-            return
+            except Exception:
+                pass
+            self._add_highlight(
+                data,
+                color="#D00000",
+                opacity=0.55,
+                show_edges=True,
+                edge_color="#D00000",
+                line_width=2,
+            )
+
+    def _set_highlight_data(self, mesh, grid, key: str):  # noqa: ANN001
+        """
+        Dataset drawn for a highlighted set (None if there is nothing to draw).
+        """
+        arr = self._set_arrays.get(key)
+        if arr is None:
+            arr = _asi64(mesh.get(key, []))
+        if key.startswith("node_set__"):
+            nodes = _in_range(arr.reshape(-1), self._grid_n_points)
+            if nodes.size == 0:
+                return None
+            return _pv().PolyData(self._grid_points_np[nodes])
         if key.startswith("edge_set__"):
-            pairs = np.asarray(mesh.get(key, []), dtype=np.int64).reshape(-1, 2)
+            pairs = arr.reshape(-1, 2)
             if pairs.size == 0:
-                return
-            uniq = np.unique(pairs.ravel())
-            pts = np.asarray(mesh["points"], dtype=float)[uniq]
-            pts3 = np.column_stack(
-                [pts[:, 0], pts[:, 1], np.zeros((pts.shape[0],), dtype=float)]
-            )
-            idx = {int(nid): i for i, nid in enumerate(uniq)}
-            lines = []
-            for a, b in pairs:
-                lines.extend([2, idx[int(a)], idx[int(b)]])
-            poly = pv.PolyData(pts3)
-            poly.lines = np.asarray(lines, dtype=np.int64)
-            self._viewer.add_mesh(poly, color="#D00000", line_width=4)
-            return
+                return None
+            # Same path as the selection overlay: gather from the grid's 3D
+            # points and let _edge_lines drop pairs with out-of-range ends.
+            uniq = _in_range(np.unique(pairs.ravel()), self._grid_n_points)
+            if uniq.size == 0:
+                return None
+            conn = _edge_lines(pairs, uniq)
+            if conn.size == 0:
+                return None
+            return _line_polydata(self._grid_points_np[uniq], conn)
         if key.startswith("elem_set__"):
             # elem_set__NAME__tri3/quad4 -> local ids per cell type
             rest = key.split("__", 1)[1]
             parts = rest.split("__")
             if len(parts) < 2:
-                return
+                return None
             cell_type = parts[1]
-            local_ids = np.asarray(mesh.get(key, []), dtype=np.int64).reshape(-1)
+            local_ids = arr.reshape(-1)
             if local_ids.size == 0:
-                return
+                return None
             if cell_type == "tri3":
                 vtk_ids = local_ids
             elif cell_type == "quad4":
                 vtk_ids = self._n_tri + local_ids
             else:
                 vtk_ids = local_ids
-            vtk_ids = np.asarray(vtk_ids, dtype=np.int64).reshape(-1)
-            vtk_ids = vtk_ids[(vtk_ids >= 0) & (vtk_ids < int(grid.n_cells))]
+            vtk_ids = _in_range(vtk_ids, self._grid_n_cells)
             if vtk_ids.size == 0:
-                return
-            sub = grid.extract_cells(vtk_ids)
-            # Make it very visible over the base mesh: thick wireframe + semi-transparent fill.
+                return None
+            return self._extract_cells(grid, vtk_ids)
+        return None
+
+    def _extract_cells(self, grid, vtk_ids):  # noqa: ANN001
+        """
+        Geometry-only extract for highlighting: extracts from a shallow copy of
+        the grid without point/cell arrays, so none of them are copied.
+        """
+        geom = self._grid_geom
+        if geom is None:
             try:
-                self._viewer.add_mesh(
-                    sub, style="wireframe", color="#D00000", line_width=5
-                )
+                geom = grid.copy(deep=False)
+                geom.clear_data()
             except Exception:
-                pass
-            self._viewer.add_mesh(
-                sub,
-                color="#D00000",
-                opacity=0.55,
-                show_edges=True,
-                edge_color="#D00000",
-                line_width=2,
+                geom = grid
+            self._grid_geom = geom
+        try:
+            return geom.extract_cells(
+                vtk_ids, pass_cell_ids=False, pass_point_ids=False
             )
+        except TypeError:
+            # pyvista without the pass_*_ids options.
+            return geom.extract_cells(vtk_ids)
+
+    def _selected_nodes_array(self):  # noqa: ANN001
+        """
+        Selected node ids as a sorted int64 array (cached until the selection changes).
+        """
+        arr = self._sel_nodes_arr
+        if arr is None:
+            arr = np.fromiter(
+                self._sel_nodes, dtype=np.int64, count=len(self._sel_nodes)
+            )
+            arr.sort()
+            self._sel_nodes_arr = arr
+        return arr
 
     def _highlight_selection(self, mesh, grid) -> None:  # noqa: ANN001
         if self._viewer is None:
             return
-        import numpy as np
-        import pyvista as pv  # type: ignore
-
-        nodes = np.asarray(sorted(self._sel_nodes), dtype=np.int64).reshape(-1)
+        pv = _pv()
+        nodes = self._selected_nodes_array()
         if nodes.size:
-            nodes = nodes[(nodes >= 0) & (nodes < int(grid.n_points))]
+            nodes = _in_range(nodes, self._grid_n_points)
             if nodes.size:
-                pts = np.asarray(grid.points)[nodes]
+                pts = self._grid_points_np[nodes]
                 pd = pv.PolyData(pts)
-                self._viewer.add_mesh(
+                self._add_highlight(
                     pd, color="#FF8800", point_size=14, render_points_as_spheres=False
                 )
 
         if self._sel_edges:
-            pairs = np.asarray(sorted(self._sel_edges), dtype=np.int64).reshape(-1, 2)
+            # Edge order does not matter for drawing; skip sorting the tuples.
+            n_edges = len(self._sel_edges)
+            pairs = np.fromiter(
+                (x for e in self._sel_edges for x in e),
+                dtype=np.int64,
+                count=2 * n_edges,
+            ).reshape(-1, 2)
             uniq = np.unique(pairs.ravel())
-            uniq = uniq[(uniq >= 0) & (uniq < int(grid.n_points))]
+            uniq = _in_range(uniq, self._grid_n_points)
             if uniq.size:
-                pts = np.asarray(grid.points)[uniq]
-                idx = {int(nid): i for i, nid in enumerate(uniq.tolist())}
-                lines: list[int] = []
-                for a, b in pairs.tolist():
-                    if int(a) in idx and int(b) in idx:
-                        lines.extend([2, idx[int(a)], idx[int(b)]])
-                if lines:
-                    poly = pv.PolyData(pts)
-                    poly.lines = np.asarray(lines, dtype=np.int64)
-                    self._viewer.add_mesh(poly, color="#FF8800", line_width=3)
+                pts = self._grid_points_np[uniq]
+                conn = _edge_lines(pairs, uniq)
+                if conn.size:
+                    poly = _line_polydata(pts, conn)
+                    self._add_highlight(poly, color="#FF8800", line_width=3)
 
         for cell_type, ids_set in self._sel_elems.items():
             if not ids_set:
                 continue
-            local_ids = np.asarray(sorted(ids_set), dtype=np.int64).reshape(-1)
-            if local_ids.size == 0:
-                continue
+            local_ids = np.fromiter(ids_set, dtype=np.int64, count=len(ids_set))
+            local_ids.sort()
             if cell_type == "tri3":
                 vtk_ids = local_ids
             elif cell_type == "quad4":
                 vtk_ids = self._n_tri + local_ids
             else:
                 vtk_ids = local_ids
-            vtk_ids = vtk_ids[(vtk_ids >= 0) & (vtk_ids < int(grid.n_cells))]
+            vtk_ids = _in_range(vtk_ids, self._grid_n_cells)
             if vtk_ids.size == 0:
                 continue
-            sub = grid.extract_cells(vtk_ids)
-            self._viewer.add_mesh(
+            sub = self._extract_cells(grid, vtk_ids)
+            self._add_highlight(
                 sub,
                 color="#FF8800",
                 opacity=0.65,
@@ -925,8 +1885,6 @@ class InputWorkspace:
         if not isinstance(mesh, dict) or "points" not in mesh:
             return
         try:
-            import numpy as np
-
             grid, _ = self._ensure_grid()
             if grid is None:
                 return
@@ -942,12 +1900,12 @@ class InputWorkspace:
                 pz = float(point[2]) if len(point) >= 3 else 0.0
             else:
                 return
-            pid = int(grid.find_closest_point((px, py, pz)))
+            pid = self._closest_point(grid, (px, py, pz))
             self._last_probe_pid = pid
             self._last_probe_xy = (float(px), float(py))
             self._last_probe_pid_history.append(pid)
             self._last_probe_pid_history = self._last_probe_pid_history[-2:]
-            node_sets = self._node_set_membership.get(pid, [])
+            node_sets = self._node_membership_for(pid)
             self._sel_info.setText(
                 f"Pick node: pid={pid} x={px:.6g} y={py:.6g} node_sets={node_sets}"
             )
@@ -985,77 +1943,146 @@ class InputWorkspace:
                     cell_id = int(kwargs["cell_id"])
                 except Exception:
                     cell_id = None
-            if cell_id is None or cell_id < 0 or cell_id >= grid.n_cells:
+            if cell_id is None or cell_id < 0 or cell_id >= self._grid_n_cells:
+                return
+            if self._cell_type_codes is None:
                 return
-            ctype_code = int(grid.cell_data["__cell_type_code"][cell_id])
-            local_id = int(grid.cell_data["__cell_local_id"][cell_id])
+            # .item() gives plain ints straight from the cached int64 arrays.
+            ctype_code = self._cell_type_codes[cell_id].item()
+            local_id = self._cell_local_ids[cell_id].item()
             ctype = cell_type_code_to_name(ctype_code) or str(ctype_code)
-            self._last_cell = (str(ctype), int(local_id))
-            elem_sets = self._elem_set_membership.get(ctype, {}).get(local_id, [])
+            self._last_cell = (ctype, local_id)
+            elem_sets = self._elem_membership_for(ctype, local_id)
             self._sel_info.setText(
                 f"Pick cell: cell_id={cell_id} type={ctype} local_id={local_id} elem_sets={elem_sets}"
             )
         except Exception:
             pass
 
+    def _set_if_changed(self, widget, setter: str, value) -> None:  # noqa: ANN001
+        # setText()/setEnabled() re-layout or re-polish even for unchanged
+        # values; remember the last value per (widget, setter) and skip no-ops.
+        key = (widget, setter)
+        if key in self._widget_state and self._widget_state[key] == value:
+            return
+        self._widget_state[key] = value
+        getattr(widget, setter)(value)
+
     def _update_selection_ui(self) -> None:
+        """
+        Schedule a selection label/button refresh (coalesced, ~33 ms).
+        """
+        # Every selection change comes through here; a repeated brush box
+        # must be re-applied after one.
+        self._last_frustum_key = None
+        if not self.widget.isVisible():
+            self._sel_ui_dirty = True
+            return
+        if not self._sel_ui_timer.isActive():
+            self._sel_ui_timer.start()
+
+    def _on_sel_ui_timer(self) -> None:
+        # The tab may have been switched away after the refresh was scheduled.
+        if not self.widget.isVisible():
+            self._sel_ui_dirty = True
+            return
+        self._do_update_selection_ui()
+
+    def _do_update_selection_ui(self) -> None:
         n_nodes = len(self._sel_nodes)
         n_edges = len(self._sel_edges)
-        n_elems = sum(len(v) for v in self._sel_elems.values())
-        self._lbl_sel_nodes.setText(f"Nodes: {n_nodes}")
-        self._lbl_sel_edges.setText(f"Edges: {n_edges}")
+        elem_counts = tuple(
+            (k, len(v)) for k, v in sorted(self._sel_elems.items()) if v
+        )
+        # Everything the labels/buttons below depend on; skip when unchanged.
+        state = (
+            n_nodes,
+            n_edges,
+            elem_counts,
+            self._box_mode,
+            self._last_probe_pid is not None,
+            len(self._last_probe_pid_history) >= 2,
+            self._last_cell is not None,
+            bool(self._polyline_active),
+            bool(self._polyline_nodes),
+        )
+        if state == self._sel_ui_state:
+            return
+        self._sel_ui_state = state
+        set_ = self._set_if_changed
+        n_elems = sum(c for _, c in elem_counts)
+        set_(self._lbl_sel_nodes, "setText", f"Nodes: {n_nodes}")
+        set_(self._lbl_sel_edges, "setText", f"Edges: {n_edges}")
         if self._sel_elems:
-            parts = [f"{k}:{len(v)}" for k, v in sorted(self._sel_elems.items()) if v]
-            self._lbl_sel_elems.setText(
-                f"Elements: {n_elems}  ({', '.join(parts)})"
-                if parts
-                else f"Elements: {n_elems}"
+            parts = [f"{k}:{c}" for k, c in elem_counts]
+            set_(
+                self._lbl_sel_elems,
+                "setText",
+                (
+                    f"Elements: {n_elems}  ({', '.join(parts)})"
+                    if parts
+                    else f"Elements: {n_elems}"
+                ),
             )
         else:
-            self._lbl_sel_elems.setText(f"Elements: {n_elems}")
+            set_(self._lbl_sel_elems, "setText", f"Elements: {n_elems}")
         try:
-            self._lbl_selection.setText(
-                f"Selection: {n_nodes}N / {n_edges}E / {n_elems}El"
+            set_(
+                self._lbl_selection,
+                "setText",
+                f"Selection: {n_nodes}N / {n_edges}E / {n_elems}El",
             )
         except Exception:
             pass
 
-        self._btn_add_node.setEnabled(self._last_probe_pid is not None)
-        self._btn_add_edge.setEnabled(len(self._last_probe_pid_history) >= 2)
-        self._btn_add_cell.setEnabled(self._last_cell is not None)
-        self._btn_clear_sel.setEnabled(bool(n_nodes or n_edges or n_elems))
-        self._btn_create_node_set.setEnabled(bool(n_nodes))
-        self._btn_create_edge_set.setEnabled(bool(n_edges))
-        self._btn_create_elem_set.setEnabled(bool(n_elems))
+        set_(self._btn_add_node, "setEnabled", self._last_probe_pid is not None)
+        set_(self._btn_add_edge, "setEnabled", len(self._last_probe_pid_history) >= 2)
+        set_(self._btn_add_cell, "setEnabled", self._last_cell is not None)
+        set_(self._btn_clear_sel, "setEnabled", bool(n_nodes or n_edges or n_elems))
+        set_(self._btn_create_node_set, "setEnabled", bool(n_nodes))
+        set_(self._btn_create_edge_set, "setEnabled", bool(n_edges))
+        set_(self._btn_create_elem_set, "setEnabled", bool(n_elems))
 
         active = self._box_mode is not None
-        self._btn_box_nodes.setText(
-            "Cancel box" if self._box_mode == "node" else "Box nodes"
+        set_(
+            self._btn_box_nodes,
+            "setText",
+            "Cancel box" if self._box_mode == "node" else "Box nodes",
+        )
+        set_(
+            self._btn_box_cells,
+            "setText",
+            "Cancel box" if self._box_mode == "cell" else "Box elems",
         )
-        self._btn_box_cells.setText(
-            "Cancel box" if self._box_mode == "cell" else "Box elems"
+        set_(
+            self._btn_box_nodes, "setEnabled", (not active) or self._box_mode == "node"
+        )
+        set_(
+            self._btn_box_cells, "setEnabled", (not active) or self._box_mode == "cell"
         )
-        self._btn_box_nodes.setEnabled((not active) or self._box_mode == "node")
-        self._btn_box_cells.setEnabled((not active) or self._box_mode == "cell")
 
         # Polyline boundary mode
         poly_active = bool(self._polyline_active)
-        self._btn_polyline.setText("Cancel polyline" if poly_active else "Polyline")
-        self._btn_polyline_finish.setEnabled(poly_active)
-        self._btn_polyline_clear.setEnabled(
-            poly_active or bool(self._polyline_nodes) or bool(self._sel_edges)
+        set_(
+            self._btn_polyline,
+            "setText",
+            "Cancel polyline" if poly_active else "Polyline",
         )
         # Avoid mixing interaction modes (box selection uses same picking pipeline).
-        self._btn_polyline.setEnabled(not active)
-        self._btn_polyline_finish.setEnabled(poly_active and (not active))
-        self._btn_polyline_clear.setEnabled(
+        set_(self._btn_polyline, "setEnabled", not active)
+        set_(self._btn_polyline_finish, "setEnabled", poly_active and (not active))
+        set_(
+            self._btn_polyline_clear,
+            "setEnabled",
             (poly_active or bool(self._polyline_nodes) or bool(self._sel_edges))
-            and (not active)
+            and (not active),
         )
 
         # Boundary component extraction is based on the last pick.
         can_comp = self._last_probe_pid is not None
-        self._btn_boundary_component.setEnabled(bool(can_comp) and (not active))
+        set_(
+            self._btn_boundary_component, "setEnabled", bool(can_comp) and (not active)
+        )
 
     def _cancel_active_interaction(self) -> None:
         """
@@ -1078,10 +2105,12 @@ class InputWorkspace:
             return
 
     def _on_replace_toggled(self, on: bool) -> None:
+        self._box_replace = bool(on)
         if not bool(on):
             return
         try:
-            if self._chk_box_subtract.isChecked():
+            if self._box_subtract:
+                self._box_subtract = False
                 self._chk_box_subtract.blockSignals(True)
                 self._chk_box_subtract.setChecked(False)
                 self._chk_box_subtract.blockSignals(False)
@@ -1089,10 +2118,12 @@ class InputWorkspace:
             pass
 
     def _on_subtract_toggled(self, on: bool) -> None:
+        self._box_subtract = bool(on)
         if not bool(on):
             return
         try:
-            if self._chk_box_replace.isChecked():
+            if self._box_replace:
+                self._box_replace = False
                 self._chk_box_replace.blockSignals(True)
                 self._chk_box_replace.setChecked(False)
                 self._chk_box_replace.blockSignals(False)
@@ -1123,8 +2154,7 @@ class InputWorkspace:
         # Rectangle picking conflicts with any existing picking mode in pyvista.
         self._disable_all_picking()
         self._box_mode = mode
-        self._box_replace = bool(self._chk_box_replace.isChecked())
-        self._box_brush = bool(self._chk_box_brush.isChecked())
+        self._last_frustum_key = None
         self._sel_info.setText(f"Box select {mode}: drag a rectangle in the viewport.")
         self._update_selection_ui()
 
@@ -1164,26 +2194,43 @@ class InputWorkspace:
         pyvista's rectangle picking callback provides a RectangleSelection
         object (viewport + frustum), not a dataset. We therefore extract
         selected points/cells using VTK filters, while preserving original
-        ids via vtkIdFilter.
+        ids via vtkIdFilter. The raw VTK output is returned (read it with
+        _get_array); it is reused by the next pick.
         """
         grid, _ = self._ensure_grid()
         if grid is None:
             return None
+        vtk = _vtk()
+        if not vtk:
+            return None
         try:
-            import pyvista as pv  # type: ignore
-            import vtk  # type: ignore
-
-            # Prefer vtkExtractSelectedFrustum (matches rubber-band picking semantics).
-            if hasattr(vtk, "vtkExtractSelectedFrustum"):
-                esf = vtk.vtkExtractSelectedFrustum()
-                esf.SetInputData(grid)  # type: ignore[arg-type]
-                esf.SetFrustum(frustum)
+            # The extraction filter stays bound to the grid (reset by _set_grid),
+            # so brush strokes only swap the frustum and re-run it.
+            cached = self._frustum_filter
+            if cached is None:
+                cached = self._make_frustum_filter(vtk, grid)
+                self._frustum_filter = cached
+            flt, node = cached
+            if node is not None:
+                # vtkExtractSelection: swap the FRUSTUM selection list in place.
                 try:
-                    esf.PreserveTopologyOff()
+                    corners = vtk.vtkDoubleArray()
+                    corners.SetNumberOfComponents(4)
+                    for row in _frustum_corners(frustum):
+                        corners.InsertNextTuple4(*row)
+                    node.SetSelectionList(corners)
+                    flt.Modified()
+                    flt.Update()
+                    return flt.GetOutput()
                 except Exception:
-                    pass
-                esf.Update()
-                return pv.wrap(esf.GetOutput())
+                    cached = self._make_frustum_filter(vtk, grid, use_selection=False)
+                    self._frustum_filter = cached
+                    flt, node = cached
+            if flt is not None:
+                # Legacy vtkExtractSelectedFrustum (same rubber-band semantics).
+                flt.SetFrustum(frustum)
+                flt.Update()
+                return flt.GetOutput()
 
             # Fallback: geometry extraction (less accurate for screen-space selection).
             idf = vtk.vtkIdFilter()
@@ -1203,10 +2250,67 @@ class InputWorkspace:
             eg.ExtractInsideOn()
             eg.ExtractBoundaryCellsOn()
             eg.Update()
-            return pv.wrap(eg.GetOutput())
+            return eg.GetOutput()
         except Exception:
             return None
 
+    def _frustum_may_hit_grid(self, frustum) -> bool:  # noqa: ANN001
+        """
+        False only if no cell's bounding sphere reaches into the frustum (the
+        cell centroids/radii are cached per grid); True when unsure.
+        """
+        try:
+            spheres = self._cell_spheres
+            if spheres is None:
+                from geohpem.viz.vtk_convert import cell_bounding_spheres
+
+                centers, radii = cell_bounding_spheres(self._mesh)
+                if centers.shape[0] != self._grid_n_cells:
+                    return True
+                # float32 slack so rounding never culls a touching cell.
+                slack = 1e-4 * float(np.abs(centers).max(initial=1.0))
+                spheres = self._cell_spheres = (centers, radii + np.float32(slack))
+            centers, radii = spheres
+            return bool(_frustum_cull(frustum, centers, radii).any())
+        except Exception:
+            return True
+
+    @staticmethod
+    def _make_frustum_filter(vtk, grid, *, use_selection: bool = True):  # noqa: ANN001
+        """
+        (filter, selection node) for frustum extraction on grid.
+
+        Prefers vtkExtractSelection fed by a reusable FRUSTUM vtkSelectionNode
+        (cell field, like rubber-band picking); falls back to
+        (vtkExtractSelectedFrustum, None), or (None, None) if neither exists.
+        """
+        if (
+            use_selection
+            and hasattr(vtk, "vtkExtractSelection")
+            and hasattr(vtk, "vtkSelectionNode")
+        ):
+            try:
+                node = vtk.vtkSelectionNode()
+                node.SetContentType(vtk.vtkSelectionNode.FRUSTUM)
+                node.SetFieldType(vtk.vtkSelectionNode.CELL)
+                sel = vtk.vtkSelection()
+                sel.AddNode(node)
+                ext = vtk.vtkExtractSelection()
+                ext.SetInputData(0, grid)
+                ext.SetInputData(1, sel)
+                return ext, node
+            except Exception:
+                pass
+        if hasattr(vtk, "vtkExtractSelectedFrustum"):
+            esf = vtk.vtkExtractSelectedFrustum()
+            esf.SetInputData(grid)  # type: ignore[arg-type]
+            try:
+                esf.PreserveTopologyOff()
+            except Exception:
+                pass
+            return esf, None
+        return None, None
+
     def _on_box_picked(self, selection) -> None:  # noqa: ANN001
         if self._viewer is None:
             return
@@ -1216,122 +2320,116 @@ class InputWorkspace:
         frustum = getattr(selection, "frustum", None)
         if frustum is None:
             return
-        picked = self._extract_by_frustum(frustum)
-        if picked is None:
-            return
         mode = self._box_mode
         if mode not in ("node", "cell"):
             return
-        # Read live state (user may toggle while box-select is active).
-        subtract = bool(self._chk_box_subtract.isChecked())
-        replace = bool(self._chk_box_replace.isChecked()) and (not subtract)
-        brush = bool(self._chk_box_brush.isChecked())
+        # Live state via the cached checkbox mirrors (user may toggle while
+        # box-select is active).
+        subtract = self._box_subtract
+        replace = self._box_replace and (not subtract)
+        brush = self._box_brush
+        key = None
+        if brush:
+            # Re-applying the same box with the same options to the selection
+            # it produced is a no-op; skip the extraction and render.
+            fkey = _frustum_key(frustum)
+            if fkey is not None:
+                key = (fkey, mode, subtract, replace)
+                if self._last_frustum_key == key:
+                    return
+        # Cheap NumPy prepass: a box that misses every cell needs no VTK extraction.
+        culled = not self._frustum_may_hit_grid(frustum)
+        picked = None if culled else self._extract_by_frustum(frustum)
+        if picked is None and not culled:
+            return
 
         try:
             if mode == "node":
-                import numpy as np
-
                 ids: list[int] = []
-                if hasattr(picked, "point_data"):
-                    if "vtkOriginalPointIds" in picked.point_data:
-                        ids = [
-                            int(x)
-                            for x in np.asarray(
-                                picked.point_data["vtkOriginalPointIds"]
+                if not culled:
+                    arr = _get_array(picked, "point", "vtkOriginalPointIds")
+                    if arr is None:
+                        arr = _get_array(picked, "point", "__pid")
+                    if arr is not None and arr.size:
+                        # Original ids written by VTK are always valid grid ids.
+                        ids = arr.astype(np.int64, copy=False).tolist()
+                    else:
+                        # fallback: map picked points to closest original ids
+                        try:
+                            from vtk.util.numpy_support import (  # type: ignore
+                                vtk_to_numpy,
                             )
-                            .reshape(-1)
-                            .tolist()
-                        ]
-                    elif "__pid" in picked.point_data:
-                        ids = [
-                            int(x)
-                            for x in np.asarray(picked.point_data["__pid"])
-                            .reshape(-1)
-                            .tolist()
-                        ]
-                if not ids:
-                    # fallback: map picked points to closest original ids
-                    try:
-                        pts = np.asarray(picked.points, dtype=float)
-                        if pts.size:
-                            ids = [int(grid.find_closest_point(tuple(p))) for p in pts]
-                    except Exception:
-                        ids = []
-                ids = [i for i in ids if 0 <= int(i) < int(grid.n_points)]
+
+                            pts = vtk_to_numpy(picked.GetPoints().GetData())
+                            arr = self._closest_points(grid, pts)
+                        except Exception:
+                            arr = np.zeros((0,), dtype=np.int64)
+                        # Only the fallback ids need the bounds mask.
+                        ids = _in_range(arr, self._grid_n_points).tolist()
                 if subtract:
-                    self._sel_nodes.difference_update({int(i) for i in ids})
+                    self._sel_nodes.difference_update(ids)
                 elif replace:
-                    self._sel_nodes = {int(i) for i in ids}
+                    self._sel_nodes = set(ids)
                 else:
-                    self._sel_nodes.update({int(i) for i in ids})
+                    self._sel_nodes.update(ids)
+                # Keep the sorted array view in step with NumPy set ops rather
+                # than rebuilding it from the (possibly large) set.
+                cur = self._sel_nodes_arr
+                new = np.unique(np.asarray(ids, dtype=np.int64))
+                if replace:
+                    self._sel_nodes_arr = new
+                elif cur is not None and subtract:
+                    self._sel_nodes_arr = np.setdiff1d(cur, new, assume_unique=True)
+                elif cur is not None:
+                    self._sel_nodes_arr = np.union1d(cur, new)
 
             if mode == "cell":
                 if replace:
                     self._sel_elems.clear()
                 # Add by mapping picked cell_data -> (ctype, local_id)
-                import numpy as np
-
                 from geohpem.viz.vtk_convert import cell_type_code_to_name
 
-                if hasattr(picked, "cell_data"):
-                    if (
-                        "__cell_type_code" in picked.cell_data
-                        and "__cell_local_id" in picked.cell_data
-                    ):
-                        codes = np.asarray(
-                            picked.cell_data["__cell_type_code"]
-                        ).reshape(-1)
-                        lids = np.asarray(picked.cell_data["__cell_local_id"]).reshape(
-                            -1
-                        )
-                        for code, lid in zip(
-                            codes.tolist(), lids.tolist(), strict=False
-                        ):
-                            ctype = cell_type_code_to_name(int(code)) or str(code)
-                            if subtract:
-                                self._sel_elems.get(str(ctype), set()).discard(int(lid))
-                            else:
-                                self._sel_elems.setdefault(str(ctype), set()).add(
-                                    int(lid)
-                                )
+                codes = lids = None
+                if not culled:
+                    codes = _get_array(picked, "cell", "__cell_type_code")
+                    lids = _get_array(picked, "cell", "__cell_local_id")
+                    if codes is not None and lids is not None:
+                        codes = codes.astype(np.int64, copy=False)
+                        lids = lids.astype(np.int64, copy=False)
                     else:
-                        # fall back to original cell ids (vtkExtractSelectedFrustum provides vtkOriginalCellIds)
-                        cids = None
-                        if "vtkOriginalCellIds" in picked.cell_data:
-                            cids = np.asarray(
-                                picked.cell_data["vtkOriginalCellIds"]
-                            ).reshape(-1)
-                        elif "__cid" in picked.cell_data:
-                            cids = np.asarray(picked.cell_data["__cid"]).reshape(-1)
-                        if (
-                            cids is not None
-                            and "__cell_type_code" in grid.cell_data
-                            and "__cell_local_id" in grid.cell_data
-                        ):
-                            for cid in cids.tolist():
-                                try:
-                                    c = int(cid)
-                                except Exception:
-                                    continue
-                                if c < 0 or c >= int(grid.n_cells):
-                                    continue
-                                code = int(grid.cell_data["__cell_type_code"][c])
-                                lid = int(grid.cell_data["__cell_local_id"][c])
-                                ctype = cell_type_code_to_name(code) or str(code)
-                                if subtract:
-                                    self._sel_elems.get(str(ctype), set()).discard(
-                                        int(lid)
-                                    )
-                                else:
-                                    self._sel_elems.setdefault(str(ctype), set()).add(
-                                        int(lid)
-                                    )
+                        codes = lids = None
+                        # fall back to original cell ids (vtkExtractSelection provides vtkOriginalCellIds)
+                        cids = _get_array(picked, "cell", "vtkOriginalCellIds")
+                        if cids is None:
+                            cids = _get_array(picked, "cell", "__cid")
+                        if cids is not None and self._cell_type_codes is not None:
+                            cids = _in_range(
+                                cids.astype(np.int64, copy=False), self._grid_n_cells
+                            )
+                            codes = self._cell_type_codes[cids]
+                            lids = self._cell_local_ids[cids]
+                if codes is not None and lids is not None:
+                    n = min(codes.size, lids.size)
+                    codes, lids = codes[:n], lids[:n]
+                    # Split the local ids by code in one pass and resolve each
+                    # cell type name once (no per-code mask over all cells).
+                    for code, grp in _group_by_code(codes, lids):
+                        ctype = cell_type_code_to_name(code) or str(code)
+                        picked_ids = grp.tolist()
+                        if subtract:
+                            self._sel_elems.get(ctype, set()).difference_update(
+                                picked_ids
+                            )
+                        else:
+                            self._sel_elems.setdefault(ctype, set()).update(picked_ids)
                 if subtract:
                     self._sel_elems = {k: v for k, v in self._sel_elems.items() if v}
 
             self._update_selection_ui()
-            # Defer heavy VTK operations until after the picking callback returns.
-            QTimer.singleShot(0, lambda: self._render_preview())
+            # Set after the refresh, which clears it for every other change.
+            self._last_frustum_key = key
+            # Deferred (timer) render: runs after the picking callback returns.
+            self._render_preview()
         except Exception:
             pass
         finally:
@@ -1342,32 +2440,49 @@ class InputWorkspace:
     def _add_picked_node(self) -> None:
         if self._last_probe_pid is None:
             return
-        self._sel_nodes.add(int(self._last_probe_pid))
-        self._update_selection_ui()
-        try:
-            self._render_preview()
-        except Exception:
-            pass
+        self._add_picked_nodes_batch((self._last_probe_pid,))
 
     def _add_edge_from_last_two_picks(self) -> None:
         if len(self._last_probe_pid_history) < 2:
             return
-        a = int(self._last_probe_pid_history[-2])
-        b = int(self._last_probe_pid_history[-1])
-        if a == b:
-            return
-        self._sel_edges.add((min(a, b), max(a, b)))
-        self._update_selection_ui()
-        try:
-            self._render_preview()
-        except Exception:
-            pass
+        self._add_picked_edges_batch((self._last_probe_pid_history[-2:],))
 
     def _add_picked_cell(self) -> None:
         if self._last_cell is None:
             return
         ct, lid = self._last_cell
-        self._sel_elems.setdefault(str(ct), set()).add(int(lid))
+        self._add_picked_cells_batch(ct, (lid,))
+
+    def _add_picked_nodes_batch(self, ids: Iterable[int]) -> None:
+        """
+        Add many node ids with one set update and one (coalesced) refresh.
+        """
+        new = np.unique(np.fromiter(ids, dtype=np.int64))
+        if not new.size:
+            return
+        self._sel_nodes.update(new.tolist())
+        if self._sel_nodes_arr is not None:
+            self._sel_nodes_arr = np.union1d(self._sel_nodes_arr, new)
+        self._selection_changed()
+
+    def _add_picked_edges_batch(self, pairs: Iterable[Iterable[int]]) -> None:
+        """
+        Add many (a, b) node pairs as undirected edges; self-loops are skipped.
+        """
+        edges = {(min(a, b), max(a, b)) for a, b in pairs if a != b}
+        if not edges:
+            return
+        self._sel_edges.update(edges)
+        self._selection_changed()
+
+    def _add_picked_cells_batch(self, cell_type: str, ids: Iterable[int]) -> None:
+        """
+        Add many local cell ids of one cell type.
+        """
+        self._sel_elems.setdefault(cell_type, set()).update(map(int, ids))
+        self._selection_changed()
+
+    def _selection_changed(self) -> None:
         self._update_selection_ui()
         try:
             self._render_preview()
@@ -1376,6 +2491,7 @@ class InputWorkspace:
 
     def _clear_selection(self) -> None:
         self._sel_nodes.clear()
+        self._sel_nodes_arr = None
         self._sel_edges.clear()
         self._sel_elems.clear()
         self._suggest_edge_set_name = None
@@ -1400,28 +2516,27 @@ class InputWorkspace:
             self._bbox_diag = None
             return
         try:
-            import numpy as np
-
             from geohpem.domain.boundary_ops import compute_boundary_edges
 
             edges = compute_boundary_edges(mesh)
             edges = edges.reshape(-1, 2)
             adj: dict[int, list[int]] = {}
+            # Boundary edges only (a small fraction of the mesh); tolist()
+            # already yields plain ints.
             for a, b in edges.tolist():
-                ia = int(a)
-                ib = int(b)
-                adj.setdefault(ia, []).append(ib)
-                adj.setdefault(ib, []).append(ia)
+                adj.setdefault(a, []).append(b)
+                adj.setdefault(b, []).append(a)
             self._boundary_edges = edges.astype("int32", copy=False)
             self._boundary_adj = adj
 
-            pts = np.asarray(mesh.get("points", np.zeros((0, 2))), dtype=float)
+            # No dtype cast here: only the boundary rows are gathered (as
+            # float) below, so the full point array is never copied.
+            pts = np.asarray(mesh.get("points", np.zeros((0, 2))))
             if pts.ndim == 2 and pts.shape[0] > 0:
-                xmin, ymin = float(np.min(pts[:, 0])), float(np.min(pts[:, 1]))
-                xmax, ymax = float(np.max(pts[:, 0])), float(np.max(pts[:, 1]))
-                self._bbox_diag = float(
-                    ((xmax - xmin) ** 2 + (ymax - ymin) ** 2) ** 0.5
-                )
+                xy = pts[:, :2]
+                span = xy.max(axis=0) - xy.min(axis=0)
+                dx, dy = float(span[0]), float(span[1])
+                self._bbox_diag = float((dx * dx + dy * dy) ** 0.5)
             else:
                 self._bbox_diag = None
 
@@ -1447,8 +2562,6 @@ class InputWorkspace:
         Returns pid if within tolerance; otherwise None.
         """
         try:
-            import numpy as np
-
             self._ensure_boundary_graph()
             xy = self._boundary_nodes_xy
             ids = self._boundary_nodes
@@ -1522,8 +2635,8 @@ class InputWorkspace:
                 return
         if not self._polyline_nodes:
             # start new polyline
-            subtract = bool(self._chk_box_subtract.isChecked())
-            replace = bool(self._chk_box_replace.isChecked()) and (not subtract)
+            subtract = self._box_subtract
+            replace = self._box_replace and (not subtract)
             if replace:
                 self._sel_edges.clear()
             self._polyline_nodes = [pid]
@@ -1533,9 +2646,10 @@ class InputWorkspace:
         path = self._shortest_boundary_path(start, pid)
         if not path or len(path) < 2:
             return
-        subtract = bool(self._chk_box_subtract.isChecked())
+        subtract = self._box_subtract
+        # The path already holds plain ints.
         for a, b in zip(path[:-1], path[1:], strict=False):
-            e = (min(int(a), int(b)), max(int(a), int(b)))
+            e = (a, b) if a < b else (b, a)
             if subtract:
                 self._sel_edges.discard(e)
             else:
@@ -1609,7 +2723,7 @@ class InputWorkspace:
             menu.addSeparator()
 
             act_fit = menu.addAction("Fit")
-            act_fit.triggered.connect(self._fit_view)
+            act_fit.triggered.connect(self._slots.fit_view)
 
             menu.addSeparator()
 
@@ -1635,62 +2749,60 @@ class InputWorkspace:
             )
             act_clear = menu.addAction("Clear selection (C)")
             act_clear.setEnabled(has_sel)
-            act_clear.triggered.connect(self._clear_selection)
+            act_clear.triggered.connect(self._slots.clear_selection)
 
             act_inv_nodes = menu.addAction("Invert nodes")
             act_inv_nodes.setEnabled(self._mesh is not None)
-            act_inv_nodes.triggered.connect(self._invert_nodes)
+            act_inv_nodes.triggered.connect(self._slots.invert_nodes)
 
             act_inv_elems = menu.addAction("Invert elements")
             act_inv_elems.setEnabled(self._mesh is not None)
-            act_inv_elems.triggered.connect(self._invert_elems)
+            act_inv_elems.triggered.connect(self._slots.invert_elems)
 
             act_inv_edges = menu.addAction("Invert edges")
             act_inv_edges.setEnabled(self._mesh is not None)
-            act_inv_edges.triggered.connect(self._invert_edges)
+            act_inv_edges.triggered.connect(self._slots.invert_edges)
 
             act_box_nodes = menu.addAction("Box nodes (B)")
             act_box_nodes.setEnabled(self._box_mode is None)
-            act_box_nodes.triggered.connect(lambda: self._toggle_box_select("node"))
+            act_box_nodes.triggered.connect(self._slots.toggle_box_nodes)
 
             act_box_elems = menu.addAction("Box elems (Shift+B)")
             act_box_elems.setEnabled(self._box_mode is None)
-            act_box_elems.triggered.connect(lambda: self._toggle_box_select("cell"))
+            act_box_elems.triggered.connect(self._slots.toggle_box_cells)
 
             menu.addSeparator()
 
             act_poly = menu.addAction("Polyline...")
             act_poly.setEnabled(self._box_mode is None)
-            act_poly.triggered.connect(self._toggle_polyline_mode)
+            act_poly.triggered.connect(self._slots.toggle_polyline)
 
             act_comp = menu.addAction("Component from last pick")
             act_comp.setEnabled(
                 self._last_probe_pid is not None and self._box_mode is None
             )
-            act_comp.triggered.connect(self._select_boundary_component_from_pick)
+            act_comp.triggered.connect(self._slots.boundary_component)
 
             sub = menu.addMenu("Auto boundary")
             for name in ("bottom", "top", "left", "right", "all"):
                 a = sub.addAction(name.capitalize())
-                a.triggered.connect(
-                    lambda _=False, n=name: self._select_boundary_edges(n)
-                )
+                a.triggered.connect(getattr(self._slots, f"boundary_{name}"))
 
             menu.addSeparator()
 
             act_create_node = menu.addAction("Create node set...")
             act_create_node.setEnabled(bool(self._sel_nodes))
-            act_create_node.triggered.connect(self._create_node_set_from_selection)
+            act_create_node.triggered.connect(self._slots.create_node_set)
 
             act_create_edge = menu.addAction("Create edge set...")
             act_create_edge.setEnabled(bool(self._sel_edges))
-            act_create_edge.triggered.connect(self._create_edge_set_from_selection)
+            act_create_edge.triggered.connect(self._slots.create_edge_set)
 
             act_create_elem = menu.addAction("Create elem set...")
             act_create_elem.setEnabled(
                 bool(sum(len(v) for v in self._sel_elems.values()))
             )
-            act_create_elem.triggered.connect(self._create_elem_set_from_selection)
+            act_create_elem.triggered.connect(self._slots.create_elem_set)
 
             menu.exec(pos if pos is not None else self._QCursor.pos())
         except Exception:
@@ -1701,12 +2813,15 @@ class InputWorkspace:
         if not isinstance(mesh, dict):
             return
         try:
-            import numpy as np
-
             pts = np.asarray(mesh.get("points", []))
             n = int(pts.shape[0]) if pts.ndim == 2 else int(pts.size)
-            all_ids = set(range(max(n, 0)))
-            self._sel_nodes = all_ids.difference(self._sel_nodes)
+            inv = np.setdiff1d(
+                np.arange(max(n, 0), dtype=np.int64),
+                self._selected_nodes_array(),
+                assume_unique=True,
+            )
+            self._sel_nodes = set(inv.tolist())
+            self._sel_nodes_arr = inv
             self._update_selection_ui()
             self._render_preview()
         except Exception:
@@ -1717,8 +2832,6 @@ class InputWorkspace:
         if not isinstance(mesh, dict):
             return
         try:
-            import numpy as np
-
             out: dict[str, set[int]] = {}
             tri = np.asarray(mesh.get("cells_tri3", []))
             if tri.ndim == 2 and tri.shape[0] > 0:
@@ -1804,8 +2917,8 @@ class InputWorkspace:
                 self.widget, "Boundary", "No edges found in that boundary component."
             )
             return
-        subtract = bool(self._chk_box_subtract.isChecked())
-        replace = bool(self._chk_box_replace.isChecked()) and (not subtract)
+        subtract = self._box_subtract
+        replace = self._box_replace and (not subtract)
         comp_set = {tuple(sorted((int(a), int(b)))) for (a, b) in comp_edges}
         if subtract:
             self._sel_edges.difference_update(comp_set)
@@ -1841,8 +2954,8 @@ class InputWorkspace:
                 )
                 return
             sel = {tuple(map(int, row)) for row in edges.tolist()}
-            subtract = bool(self._chk_box_subtract.isChecked())
-            replace = bool(self._chk_box_replace.isChecked()) and (not subtract)
+            subtract = self._box_subtract
+            replace = self._box_replace and (not subtract)
             if subtract:
                 self._sel_edges.difference_update(sel)
                 self._suggest_edge_set_name = None
@@ -1868,7 +2981,7 @@ class InputWorkspace:
         if not ok:
             return None
         name = (txt or "").strip()
-        if not name or any(ch.isspace() for ch in name):
+        if not name or _WHITESPACE_RE.search(name):
             self._QMessageBox.warning(
                 self.widget,
                 title,
@@ -1877,6 +2990,19 @@ class InputWorkspace:
             return None
         return name
 
+    def _sorted_selection(self, kind: str, items, build) -> list:  # noqa: ANN001
+        """
+        Sorted payload for a set created from the selection; a repeated create
+        with an unchanged selection reuses the last result instead of sorting again.
+        """
+        snapshot = frozenset(items)
+        hit = self._last_set_cache.get(kind)
+        if hit is None or hit[0] != snapshot:
+            hit = (snapshot, build())
+            self._last_set_cache[kind] = hit
+        # A copy, so receivers of create_set_requested cannot alter the cache.
+        return list(hit[1])
+
     def _create_node_set_from_selection(self) -> None:
         mesh = self._mesh
         if not isinstance(mesh, dict):
@@ -1896,7 +3022,8 @@ class InputWorkspace:
             if btn != self._QMessageBox.Yes:
                 return
         self._pending_highlight_key = key
-        ids = sorted({int(x) for x in self._sel_nodes})
+        # Already sorted and unique (NumPy view of the selection set).
+        ids = self._selected_nodes_array().tolist()
         self.create_set_requested.emit(
             {"kind": "node", "name": name, "key": key, "ids": ids}
         )
@@ -1922,7 +3049,16 @@ class InputWorkspace:
             if btn != self._QMessageBox.Yes:
                 return
         self._pending_highlight_key = key
-        pairs = [[int(a), int(b)] for a, b in sorted(self._sel_edges)]
+
+        def build() -> list:
+            arr = np.fromiter(
+                (v for ab in self._sel_edges for v in ab),
+                dtype=np.int64,
+                count=2 * len(self._sel_edges),
+            ).reshape(-1, 2)
+            return arr[np.lexsort((arr[:, 1], arr[:, 0]))].tolist()
+
+        pairs = self._sorted_selection("edge", self._sel_edges, build)
         self.create_set_requested.emit(
             {"kind": "edge", "name": name, "key": key, "pairs": pairs}
         )
@@ -1959,7 +3095,14 @@ class InputWorkspace:
             if btn != self._QMessageBox.Yes:
                 return
         self._pending_highlight_key = key
-        ids = sorted({int(x) for x in self._sel_elems.get(ct, set())})
+        sel = self._sel_elems.get(ct, set())
+        ids = self._sorted_selection(
+            f"elem:{ct}",
+            sel,
+            lambda: np.unique(
+                np.fromiter(sel, dtype=np.int64, count=len(sel))
+            ).tolist(),
+        )
         self.create_set_requested.emit(
             {"kind": "elem", "name": name, "cell_type": ct, "key": key, "ids": ids}
         )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import uuid
 
 
@@ -9,3 +10,18 @@ def new_uid(prefix: str) -> str:
     """
     p = (prefix or "id").strip().lower()
     return f"{p}_{uuid.uuid4().hex}"
+
+
+def uid_prefix(prefix: str) -> str:
+    """
+    Normalize a uid prefix once (including the trailing "_") for new_uid_prefixed().
+    """
+    p = (prefix or "id").strip().lower()
+    return sys.intern(f"{p}_")
+
+
+def new_uid_prefixed(prefix_: str) -> str:
+    """
+    Like new_uid(), but takes a prefix already normalized by uid_prefix().
+    """
+    return prefix_ + uuid.uuid4().hex
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # numba is optional
+    njit = None
+
+
+def _build_csr(ids, owners, n_keys):  # noqa: ANN001
+    # Counting sort: one pass to count, prefix sum, one pass to scatter.
+    # Owners keep their input order per key (stable).
+    indptr = np.zeros(n_keys + 1, dtype=np.int64)
+    for i in range(ids.shape[0]):
+        indptr[ids[i] + 1] += 1
+    for k in range(n_keys):
+        indptr[k + 1] += indptr[k]
+    cursor = indptr[:-1].copy()
+    indices = np.empty(ids.shape[0], dtype=owners.dtype)
+    for i in range(ids.shape[0]):
+        k = ids[i]
+        indices[cursor[k]] = owners[i]
+        cursor[k] += 1
+    return indptr, indices
+
+
+_build_csr_jit = njit(cache=True)(_build_csr) if njit is not None else None
+
+
+def build_csr(ids, owners, n_keys: int) -> tuple[Any, Any] | None:  # noqa: ANN001
+    """
+    Build a CSR "key -> owners" index (indptr, indices) with a Numba kernel.
+
+    ids must be non-negative and < n_keys. Returns None when numba is not
+    installed; callers then use their NumPy path.
+    """
+    if _build_csr_jit is None:
+        return None
+    return _build_csr_jit(ids, owners, int(n_keys))
@@ -95,8 +95,38 @@ def contract_mesh_to_pyvista(mesh: dict[str, Any]) -> VtkMesh:
     return VtkMesh(grid=grid, n_points=int(points3.shape[0]), n_cells=int(grid.n_cells))
 
 
+def cell_bounding_spheres(mesh: dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-cell (centroid (n,3), radius (n,)) as float32, in the cell order of
+    contract_mesh_to_pyvista (tri3 block, then quad4). The radius is the largest
+    centroid-to-vertex distance, so every vertex lies inside the sphere.
+    """
+    points3 = _ensure_3d_points(np.asarray(mesh["points"]))
+    centers: list[np.ndarray] = []
+    radii: list[np.ndarray] = []
+    for key in ("cells_tri3", "cells_quad4"):
+        if key not in mesh:
+            continue
+        conn = np.asarray(mesh[key], dtype=np.int64)
+        if not conn.size:
+            continue
+        verts = points3[conn]  # (n, k, 3)
+        c = verts.mean(axis=1)
+        centers.append(c)
+        radii.append(np.sqrt(((verts - c[:, None, :]) ** 2).sum(axis=2)).max(axis=1))
+    if not centers:
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0,), dtype=np.float32)
+    return (
+        np.concatenate(centers).astype(np.float32),
+        np.concatenate(radii).astype(np.float32),
+    )
+
+
+_CELL_TYPE_NAMES: dict[int, str] = {1: "tri3", 2: "quad4"}
+
+
 def cell_type_code_to_name(code: int) -> str | None:
-    return {1: "tri3", 2: "quad4"}.get(int(code))
+    return _CELL_TYPE_NAMES.get(int(code))
 
 
 def available_steps_from_arrays(arrays: dict[str, Any]) -> list[int]: